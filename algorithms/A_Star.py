@@ -10,63 +10,213 @@ maze = [
 start = (0, 0)
 goal = (4, 4)
 
-from heapq import heappush, heappop
+from Indexed_Priority_Queue import IndexedPriorityQueue
+from Search_Stepper import SearchStepper, run_to_completion
 
-def is_valid(row, col):
-    """Check if the position is within bounds and is an open path (0)."""
-    return 0 <= row < len(maze) and 0 <= col < len(maze[0]) and maze[row][col] == 0
+def is_valid(row, col, grid=None):
+    """Check if the position is within bounds and is an open path (0) in grid (default: maze)."""
+    if grid is None:
+        grid = maze
+    return 0 <= row < len(grid) and 0 <= col < len(grid[0]) and grid[row][col] == 0
 
 def manhattan_distance(pos1, pos2):
     """Calculate Manhattan distance between two positions."""
     return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
 
-def a_star_search(start, goal):
+def reconstruct_path(came_from, current):
+    """Follow predecessor links back from current to the start position."""
+    path = [current]
+    while current in came_from:
+        current = came_from[current]
+        path.append(current)
+    path.reverse()
+    return path
+
+def a_star_search_steps(start, goal, nodes_per_step=100, grid=None):
     """
-    Perform A* Search to find the shortest path from start to goal.
+    Perform A* Search as a generator that yields control every nodes_per_step expansions.
     
     Args:
         - start: tuple (row, col) of start position
         - goal: tuple (row, col) of goal position
+        - nodes_per_step: maximum number of nodes to expand before yielding
+        - grid: 2D list to search instead of the module-level maze
+    
+    Yields:
+        - int: number of nodes expanded since the previous yield
     
     Returns:
-        - list of positions representing the shortest path if found, else None
+        - the result of a_star_search, as the generator's completion value
     """
-    # Priority queue to store (f_score, current_position, path)
-    queue = [(0 + manhattan_distance(start, goal), start, [start])]
+    if nodes_per_step < 1:
+        raise ValueError(f"nodes_per_step must be at least 1, got {nodes_per_step}")
+    # Indexed priority queue keyed by position with f_score priority (one entry per open node)
+    queue = IndexedPriorityQueue()
+    queue.push(start, 0 + manhattan_distance(start, goal))
     visited = set()
+    came_from = {}
     g_scores = {start: 0}  # Track actual cost from start to each node
     
     directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Up, down, left, right
     
+    expanded = 0
     while queue:
-        f_score, current, path = heappop(queue)
+        if expanded == nodes_per_step:
+            yield expanded
+            expanded = 0
+        current, f_score = queue.pop()
+        expanded += 1
         row, col = current
         
         if current == goal:
-            return path
-        
-        if current in visited:
-            continue
+            yield expanded
+            return reconstruct_path(came_from, current)
         
         visited.add(current)
         
         for dr, dc in directions:
             nr, nc = row + dr, col + dc
             next_pos = (nr, nc)
-            if is_valid(nr, nc) and next_pos not in visited:
+            if is_valid(nr, nc, grid) and next_pos not in visited:
                 new_g_score = g_scores[current] + 1  # Cost of each move is 1
                 if next_pos not in g_scores or new_g_score < g_scores[next_pos]:
                     g_scores[next_pos] = new_g_score
+                    came_from[next_pos] = current
                     f_score = new_g_score + manhattan_distance(next_pos, goal)
-                    new_path = path + [next_pos]
-                    heappush(queue, (f_score, next_pos, new_path))
+                    queue.push(next_pos, f_score)  # Inserts or decreases the key
     
+    yield expanded
     return None
 
-# Example usage
-result_path = a_star_search(start, goal)
+def a_star_search(start, goal, grid=None):
+    """
+    Perform A* Search to find the shortest path from start to goal.
+    
+    Args:
+        - start: tuple (row, col) of start position
+        - goal: tuple (row, col) of goal position
+        - grid: 2D list to search instead of the module-level maze
+    
+    Returns:
+        - list of positions representing the shortest path if found, else None
+    """
+    return run_to_completion(a_star_search_steps(start, goal, grid=grid))
+
+def nearest_goal_index(goals, rows, cols):
+    """
+    Precompute the Manhattan distance from every cell to its nearest goal.
+    
+    Walls are ignored, so each entry is an admissible and consistent heuristic
+    for reaching any of the goals. Built with a two-pass distance transform.
+    
+    Args:
+        - goals: iterable of (row, col) goal positions
+        - rows, cols: grid dimensions
+    
+    Returns:
+        - 2D list of distances to the nearest goal
+    """
+    infinity = rows + cols
+    index = [[infinity] * cols for _ in range(rows)]
+    for row, col in goals:
+        index[row][col] = 0
+    # Forward pass: nearest goal above or to the left
+    for row in range(rows):
+        for col in range(cols):
+            if row > 0:
+                index[row][col] = min(index[row][col], index[row - 1][col] + 1)
+            if col > 0:
+                index[row][col] = min(index[row][col], index[row][col - 1] + 1)
+    # Backward pass: nearest goal below or to the right
+    for row in range(rows - 1, -1, -1):
+        for col in range(cols - 1, -1, -1):
+            if row < rows - 1:
+                index[row][col] = min(index[row][col], index[row + 1][col] + 1)
+            if col < cols - 1:
+                index[row][col] = min(index[row][col], index[row][col + 1] + 1)
+    return index
+
+def k_nearest_goals_search(start, goals, k=1, grid=None, index=None):
+    """
+    Perform one A* Search that reaches the k closest of several goals.
+    
+    The heuristic is the distance to the nearest goal from a precomputed
+    index, so goals are popped in increasing path cost order.
+    
+    Args:
+        - start: tuple (row, col) of start position
+        - goals: iterable of (row, col) goal positions
+        - k: number of nearest goals to return
+        - grid: 2D list to search instead of the module-level maze
+        - index: result of nearest_goal_index for these goals, to reuse across queries
+    
+    Returns:
+        - list of (goal, path) tuples in increasing path length, at most k long
+    """
+    if grid is None:
+        grid = maze
+    goals = set(goals)
+    if index is None:
+        index = nearest_goal_index(goals, len(grid), len(grid[0]))
+    
+    queue = IndexedPriorityQueue()
+    queue.push(start, index[start[0]][start[1]])
+    visited = set()
+    came_from = {}
+    g_scores = {start: 0}
+    found = []
+    
+    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Up, down, left, right
+    
+    while queue and len(found) < k:
+        current, _ = queue.pop()
+        row, col = current
+        visited.add(current)
+        
+        if current in goals:
+            found.append((current, reconstruct_path(came_from, current)))
+        
+        for dr, dc in directions:
+            nr, nc = row + dr, col + dc
+            next_pos = (nr, nc)
+            if is_valid(nr, nc, grid) and next_pos not in visited:
+                new_g_score = g_scores[current] + 1
+                if next_pos not in g_scores or new_g_score < g_scores[next_pos]:
+                    g_scores[next_pos] = new_g_score
+                    came_from[next_pos] = current
+                    queue.push(next_pos, new_g_score + index[nr][nc])
+    
+    return found
+
+def nearest_goal_search(start, goals, grid=None, index=None):
+    """
+    Find the closest of several goals with a single A* Search.
+    
+    Returns:
+        - tuple (goal, path) for the nearest reachable goal, else None
+    """
+    found = k_nearest_goals_search(start, goals, 1, grid, index)
+    return found[0] if found else None
+
+if __name__ == "__main__":
+    # Example usage
+    result_path = a_star_search(start, goal)
+
+    if result_path:
+        print("Path found:", result_path)
+    else:
+        print("No path found.")
+
+    # Time-sliced usage: expand at most 4 nodes per frame until the search finishes
+    stepper = SearchStepper(a_star_search_steps(start, goal, nodes_per_step=4))
+    frames = 0
+    while not stepper.done:
+        stepper.step()
+        frames += 1
+    print(f"Stepped search finished after {frames} frames ({stepper.expanded} nodes):", stepper.result)
 
-if result_path:
-    print("Path found:", result_path)
-else:
-    print("No path found.")
\ No newline at end of file
+    # Multi-goal usage: nearest of several candidate goals in one search
+    candidates = [(4, 4), (0, 4), (4, 0)]
+    print("Nearest goal:", nearest_goal_search(start, candidates))
+    for found_goal, found_path in k_nearest_goals_search(start, candidates, k=3):
+        print(f"Goal {found_goal} at cost {len(found_path) - 1}")
\ No newline at end of file
@@ -10,47 +10,128 @@ maze = [
 start = (0, 0)
 goal = (4, 4)
 
+from Search_Stepper import run_to_completion
+
 # Helper function to check if move is valid
 def is_valid_move(maze, visited, x, y):
     return 0 <= x < len(maze) and 0 <= y < len(maze[0]) and not visited[x][y] and maze[x][y] == 0
 
-# BFS implementation using List as a queue
-def bfs(maze, start, goal):
+# Resumable BFS that yields its expansion count every nodes_per_step nodes
+def bfs_steps(maze, start, goal, nodes_per_step=100):
+    if nodes_per_step < 1:
+        raise ValueError(f"nodes_per_step must be at least 1, got {nodes_per_step}")
     queue = [(start, [start])]
     visited = [[False]*len(maze[0]) for _ in range(len(maze))]
     visited[start[0]][start[1]] = True
     
+    expanded = 0
     while queue:
+        if expanded == nodes_per_step:
+            yield expanded
+            expanded = 0
         (x, y), path = queue.pop(0)  # FIFO behavior using List
+        expanded += 1
         if (x, y) == goal:
+            yield expanded
             return path
         for dx, dy in [(0,1), (1,0), (0,-1), (-1,0)]:
             nx, ny = x+dx, y+dy
             if is_valid_move(maze, visited, nx, ny):
                 visited[nx][ny] = True
                 queue.append(((nx, ny), path + [(nx, ny)]))
+    yield expanded
     return None
 
-# DFS implementation using stack
-def dfs(maze, start, goal):
+# BFS implementation using List as a queue
+def bfs(maze, start, goal):
+    return run_to_completion(bfs_steps(maze, start, goal))
+
+# Resumable DFS that yields its expansion count every nodes_per_step nodes
+def dfs_steps(maze, start, goal, nodes_per_step=100):
+    if nodes_per_step < 1:
+        raise ValueError(f"nodes_per_step must be at least 1, got {nodes_per_step}")
     stack = [(start, [start])]
     visited = [[False]*len(maze[0]) for _ in range(len(maze))]
     visited[start[0]][start[1]] = True
     
+    expanded = 0
     while stack:
+        if expanded == nodes_per_step:
+            yield expanded
+            expanded = 0
         (x, y), path = stack.pop()
+        expanded += 1
         if (x, y) == goal:
+            yield expanded
             return path
         for dx, dy in [(0,1), (1,0), (0,-1), (-1,0)]:
             nx, ny = x+dx, y+dy
             if is_valid_move(maze, visited, nx, ny):
                 visited[nx][ny] = True
                 stack.append(((nx, ny), path + [(nx, ny)]))
+    yield expanded
     return None
 
-# Run BFS and DFS
-bfs_path = bfs(maze, start, goal)
-dfs_path = dfs(maze, start, goal)
+# DFS implementation using stack
+def dfs(maze, start, goal):
+    return run_to_completion(dfs_steps(maze, start, goal))
+
+# Frontier search: expand one BFS layer keeping only the previous and current layers.
+# On an undirected grid every neighbour of layer k lies in layer k-1, k or k+1,
+# so subtracting those two layers is enough to stop the search from going back.
+def next_layer(maze, previous, current):
+    layer = set()
+    for x, y in current:
+        for dx, dy in [(0,1), (1,0), (0,-1), (-1,0)]:
+            nx, ny = x+dx, y+dy
+            if 0 <= nx < len(maze) and 0 <= ny < len(maze[0]) and maze[nx][ny] == 0:
+                layer.add((nx, ny))
+    return layer - current - previous
+
+# Distance from start to goal using frontier layers only, or None if unreachable
+def frontier_distance(maze, start, goal):
+    previous, current = set(), {start}
+    depth = 0
+    while current:
+        if goal in current:
+            return depth
+        previous, current = current, next_layer(maze, previous, current)
+        depth += 1
+    return None
+
+# Cells at exactly the given distance from source (the BFS layer at that depth)
+def frontier_layer_at(maze, source, depth):
+    previous, current = set(), {source}
+    for _ in range(depth):
+        previous, current = current, next_layer(maze, previous, current)
+    return current
+
+# Shortest path of known length between two cells, recovered by divide and conquer:
+# a midpoint at distance half from start and distance - half from goal lies on an
+# optimal path, so solve both halves recursively instead of storing predecessors.
+def frontier_path(maze, start, goal, distance):
+    if distance == 0:
+        return [start]
+    if distance == 1:
+        return [start, goal]
+    half = distance // 2
+    midpoints = frontier_layer_at(maze, start, half) & frontier_layer_at(maze, goal, distance - half)
+    midpoint = min(midpoints)
+    return frontier_path(maze, start, midpoint, half)[:-1] + frontier_path(maze, midpoint, goal, distance - half)
+
+# BFS whose memory grows with the frontier width instead of the map area
+def frontier_bfs(maze, start, goal):
+    distance = frontier_distance(maze, start, goal)
+    if distance is None:
+        return None
+    return frontier_path(maze, start, goal, distance)
+
+if __name__ == "__main__":
+    # Run BFS and DFS
+    bfs_path = bfs(maze, start, goal)
+    dfs_path = dfs(maze, start, goal)
+    frontier_path_found = frontier_bfs(maze, start, goal)
 
-print("BFS Path:", bfs_path)
-print("DFS Path:", dfs_path)
\ No newline at end of file
+    print("BFS Path:", bfs_path)
+    print("DFS Path:", dfs_path)
+    print("Frontier BFS Path:", frontier_path_found)
\ No newline at end of file
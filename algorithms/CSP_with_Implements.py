@@ -1,197 +1,200 @@
 # Timetabling as a CSP with MRV, Degree, LCV, Forward Checking, and Arc Consistency
+#
+# The search runs on a CompiledCSP: courses and timeslots are indices, and each
+# heuristic or propagation step only visits the neighbours of a course.
+#
+# There is one list of domains for the whole search. Every change to it, by
+# forward checking or by AC-3, first pushes (variable, old domain) onto a
+# trail. Backtracking pops the trail back to the length it had before the
+# assignment, so each node costs memory in proportion to the domains it
+# changed, and every pruning is undone.
 
-from collections import defaultdict, deque
+from collections import deque
 import random
+import sys
 
-def get_initial_domains(variables, domain):
+from Compiled_CSP import CompiledCSP, domain_values
+
+def get_initial_domains(problem):
     """Initialize domains for each variable."""
-    return {var: domain[:] for var in variables}
+    return problem.initial_domains()
 
-def get_degree(var, constraints, assignment):
+def get_degree(problem, var, assignment):
     """Calculate the number of constraints involving var with unassigned variables."""
-    return sum(1 for v1, v2 in constraints if v1 == var and v2 not in assignment or v2 == var and v1 not in assignment)
+    return sum(1 for other in problem.neighbors[var] if other not in assignment)
 
-def select_unassigned_variable(assignment, domains, constraints):
+def select_unassigned_variable(problem, assignment, domains):
     """
     Select unassigned variable using MRV and Degree heuristic for tie-breaking.
     
     Args:
+    - problem: CompiledCSP with the neighbour lists
     - assignment: current partial assignment
-    - domains: dict of variables to their current domains
-    - constraints: list of (var1, var2) constraint pairs
+    - domains: list of current domain bitmasks, indexed by variable
     
     Returns:
     - selected variable or None
     """
-    unassigned = [var for var in domains if var not in assignment]
+    unassigned = [var for var in range(len(domains)) if var not in assignment]
     if not unassigned:
         return None
     
     # MRV: select variable with fewest remaining values
-    min_values = min(len(domains[var]) for var in unassigned)
-    candidates = [var for var in unassigned if len(domains[var]) == min_values]
+    min_values = min(domains[var].bit_count() for var in unassigned)
+    candidates = [var for var in unassigned if domains[var].bit_count() == min_values]
     
     # Degree heuristic: break ties by choosing variable with most constraints
-    return max(candidates, key=lambda var: get_degree(var, constraints, assignment))
+    return max(candidates, key=lambda var: get_degree(problem, var, assignment))
 
-def count_constraints(var, value, assignment, domains, constraints):
+def count_constraints(problem, var, value, assignment, domains):
     """Count how many future variables would lose the given value due to constraints."""
     count = 0
-    for v1, v2 in constraints:
-        if v1 == var and v2 not in assignment:
-            if value in domains[v2]:
-                count += 1
-        elif v2 == var and v1 not in assignment:
-            if value in domains[v1]:
-                count += 1
+    for other in problem.neighbors[var]:
+        if other not in assignment and domains[other] >> value & 1:
+            count += 1
     return count
 
-def order_domain_values(var, domains, constraints, assignment):
+def order_domain_values(problem, var, domains, assignment):
     """
     Order domain values using Least Constraining Value (LCV) heuristic.
     
     Args:
+    - problem: CompiledCSP with the neighbour lists
     - var: variable to assign
     - domains: current domains
-    - constraints: list of constraint pairs
     - assignment: current partial assignment
     
     Returns:
     - sorted list of domain values
     """
-    return sorted(domains[var], key=lambda val: count_constraints(var, val, assignment, domains, constraints))
+    return sorted(domain_values(domains[var]),
+                  key=lambda val: count_constraints(problem, var, val, assignment, domains))
 
-def is_consistent(var, value, assignment, constraints):
+def is_consistent(problem, var, value, assignment):
     """Check if assigning value to var is consistent with current assignment."""
-    for v1, v2 in constraints:
-        if v1 == var and v2 in assignment:
-            if assignment[v2] == value:
-                return False
-        elif v2 == var and v1 in assignment:
-            if assignment[v1] == value:
-                return False
+    for other in problem.neighbors[var]:
+        if other in assignment and assignment[other] == value:
+            return False
     return True
 
-def forward_check(var, value, domains, constraints, assignment):
+def forward_check(problem, var, value, domains, assignment, trail):
     """
     Apply forward checking to reduce domains of unassigned variables.
     
     Args:
+    - problem: CompiledCSP with the neighbour lists
     - var: assigned variable
     - value: assigned value
     - domains: current domains
-    - constraints: list of constraint pairs
     - assignment: current partial assignment
+    - trail: list of (variable, old domain) entries, extended for every reduced domain
     
     Returns:
-    - dict of reduced domains {var: [removed_values]} or None if failure
+    - bool: False if a domain became empty
     """
-    reduced_domains = defaultdict(list)
-    for v1, v2 in constraints:
-        if v1 == var and v2 not in assignment and value in domains[v2]:
-            domains[v2].remove(value)
-            reduced_domains[v2].append(value)
-        elif v2 == var and v1 not in assignment and value in domains[v1]:
-            domains[v1].remove(value)
-            reduced_domains[v1].append(value)
-    
-    # Check if any domain became empty
-    if any(len(domains[v]) == 0 for v in domains if v not in assignment):
-        return None
+    bit = 1 << value
+    for other in problem.neighbors[var]:
+        if other not in assignment and domains[other] & bit:
+            trail.append((other, domains[other]))
+            domains[other] ^= bit
+            
+            # Check if the domain became empty
+            if not domains[other]:
+                return False
     
-    return reduced_domains
+    return True
 
-def restore_domains(reduced_domains, domains):
-    """Restore domains after backtracking."""
-    for var, values in reduced_domains.items():
-        domains[var].extend(values)
+def restore_domains(trail, mark, domains):
+    """Undo the domain changes logged after the trail had length mark."""
+    while len(trail) > mark:
+        var, old_domain = trail.pop()
+        domains[var] = old_domain
 
-def ac3(domains, constraints, assignment):
+def ac3(problem, domains, assignment, changed=None, trail=None):
     """
     Enforce arc consistency using AC-3 algorithm.
     
     Args:
+    - problem: CompiledCSP with the neighbour lists
     - domains: current domains
-    - constraints: list of constraint pairs
     - assignment: current partial assignment
+    - changed: variables whose domains shrank since the domains were last
+      arc-consistent; only the arcs into them are queued at first (None: every arc)
+    - trail: list the old domains are logged to before each pruning (None: no undo)
     
     Returns:
     - bool: True if arc-consistent, False if a domain is empty
     """
-    queue = deque([(v1, v2) for v1, v2 in constraints if v1 not in assignment and v2 not in assignment])
+    neighbors = problem.neighbors
+    if changed is None:
+        queue = deque((v1, v2) for v1 in range(len(domains)) if v1 not in assignment
+                      for v2 in neighbors[v1] if v2 not in assignment)
+    else:
+        queue = deque((v1, v2) for v2 in changed if v2 not in assignment
+                      for v1 in neighbors[v2] if v1 not in assignment)
+    queued = set(queue)
     while queue:
         v1, v2 = queue.popleft()
-        removed = False
-        
-        # Check each value in v1's domain
-        values_to_remove = []
-        for x in domains[v1]:
-            consistent = False
-            for y in domains[v2]:  # Satisfies constraint (v1 != v2)
-                if x != y:
-                    consistent = True
-                    break
-            if not consistent:
-                values_to_remove.append(x)
-                removed = True
+        queued.discard((v1, v2))
         
-        for x in values_to_remove:
-            domains[v1].remove(x)
+        # Satisfies constraint (v1 != v2): a value of v1 loses its last
+        # support only when it is the single value left to v2
+        single = domains[v2]
+        if single & (single - 1) or not domains[v1] & single:
+            continue
+        if trail is not None:
+            trail.append((v1, domains[v1]))
+        domains[v1] &= ~single
         
         if not domains[v1]:
             return False
         
-        if removed:
-            # Add constraints involving v1 to queue
-            for u, v in constraints:
-                if u == v2 and v != v1 and u not in assignment:
-                    queue.append((u, v))
-                elif v == v2 and u != v1 and u not in assignment:
-                    queue.append((u, v))
+        # Arcs into v1 may have lost their support
+        for u in neighbors[v1]:
+            if u != v2 and u not in assignment and (u, v1) not in queued:
+                queue.append((u, v1))
+                queued.add((u, v1))
     
     return True
 
-def backtracking_search(variables, domains, constraints, assignment):
+def backtracking_search(problem, domains, assignment, trail=None):
     """
     Perform backtracking search with MRV, Degree, LCV, Forward Checking, and AC-3.
     
     Args:
-    - variables: list of courses
-    - domains: dict mapping courses to possible timeslots
-    - constraints: list of (course1, course2) pairs
+    - problem: CompiledCSP of the courses, timeslots and constraints
+    - domains: list of possible timeslots per course, changed in place and
+      restored on backtracking
     - assignment: current partial assignment
+    - trail: undo log shared by all levels (None: start a new one)
     
     Returns:
     - dict: complete assignment if solution found, else None
     """
-    if len(assignment) == len(variables):
+    if trail is None:
+        trail = []
+    if len(assignment) == len(problem.variables):
         return assignment
     
-    var = select_unassigned_variable(assignment, domains, constraints)
+    var = select_unassigned_variable(problem, assignment, domains)
     if var is None:
         return None
     
-    # Create a copy of domains for this recursion level
-    domains_copy = {v: d[:] for v, d in domains.items()}
-    
-    for value in order_domain_values(var, domains_copy, constraints, assignment):
-        if is_consistent(var, value, assignment, constraints):
+    for value in order_domain_values(problem, var, domains, assignment):
+        if is_consistent(problem, var, value, assignment):
             assignment[var] = value
-            reduced_domains = forward_check(var, value, domains_copy, constraints, assignment)
+            mark = len(trail)
             
-            if reduced_domains is not None:
-                # Apply AC-3 after forward checking
-                if not ac3(domains_copy, constraints, assignment):
-                    assignment.pop(var)
-                    restore_domains(reduced_domains, domains_copy)
-                    continue
-                
-                result = backtracking_search(variables, domains_copy, constraints, assignment)
+            # Apply AC-3 after forward checking, starting from the domains it reduced
+            if (forward_check(problem, var, value, domains, assignment, trail)
+                    and ac3(problem, domains, assignment, [v for v, _ in trail[mark:]], trail)):
+                result = backtracking_search(problem, domains, assignment, trail)
                 if result is not None:
                     return result
             
+            # Undo every pruning made under this value, by forward checking and by AC-3
+            restore_domains(trail, mark, domains)
             assignment.pop(var)
-            restore_domains(reduced_domains, domains_copy)
     
     return None
 
@@ -207,23 +210,28 @@ def solve_timetabling(variables, timeslots, constraints):
     Returns:
     - dict: assignment of courses to timeslots if solution found, else None
     """
-    domains = get_initial_domains(variables, timeslots)
+    problem = CompiledCSP(variables, timeslots, constraints)
+    # The search recurses once per assigned course
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), len(problem.variables) + 100))
+    domains = get_initial_domains(problem)
     # Use AC-3 initially to prune domains
     assignment = {}
-    if not ac3(domains, constraints, assignment):
+    if not ac3(problem, domains, assignment):
         return None
-    return backtracking_search(variables, domains, constraints, assignment)
+    result = backtracking_search(problem, domains, assignment)
+    return None if result is None else problem.decode(result)
 
-# Example usage
-variables = ['C1', 'C2', 'C3', 'C4', 'C5']  # Courses
-timeslots = ['T1', 'T2', 'T3', 'T4']  # Timeslots
-constraints = [('C1', 'C2'), ('C1', 'C3'), ('C3', 'C4'), ('C4', 'C5')]  # Constraints
+if __name__ == "__main__":
+    # Example usage
+    variables = ['C1', 'C2', 'C3', 'C4', 'C5']  # Courses
+    timeslots = ['T1', 'T2', 'T3', 'T4']  # Timeslots
+    constraints = [('C1', 'C2'), ('C1', 'C3'), ('C3', 'C4'), ('C4', 'C5')]  # Constraints
 
-solution = solve_timetabling(variables, timeslots, constraints)
+    solution = solve_timetabling(variables, timeslots, constraints)
 
-if solution:
-    print("Timetable solution found:")
-    for course, timeslot in solution.items():
-        print(f"{course}: {timeslot}")
-else:
-    print("No solution found.")
\ No newline at end of file
+    if solution:
+        print("Timetable solution found:")
+        for course, timeslot in solution.items():
+            print(f"{course}: {timeslot}")
+    else:
+        print("No solution found.")
\ No newline at end of file
@@ -0,0 +1,51 @@
+# Timetabling CSP compiled to integer indices
+#
+# Courses and timeslots are numbered once, and every constraint pair is
+# stored in the neighbour lists of both of its courses. The solvers in
+# Timetabling_CSP.py and CSP_with_Implements.py then work on variable and
+# value indices. Checking, counting or propagating an assignment touches
+# only the courses that share a constraint with it, instead of scanning the
+# whole constraint list at every node.
+#
+# A domain is an int bitmask over value indices: bit v is set while value v
+# is still possible. Membership, removal and restoring are single bit
+# operations, the size is a popcount and the lowest value is the lowest set
+# bit, whatever the number of timeslots.
+
+class CompiledCSP:
+    """
+    CSP whose constraints all say that two variables take different values.
+
+    Args:
+    - variables: list of variable names (courses)
+    - values: list of values every variable may take (timeslots)
+    - constraints: list of (var1, var2) pairs; repeated pairs and pairs of a
+      variable with itself are dropped
+    """
+
+    def __init__(self, variables, values, constraints):
+        self.variables = list(variables)
+        self.values = list(values)
+        self.index = {var: i for i, var in enumerate(self.variables)}
+        neighbor_sets = [set() for _ in self.variables]
+        for v1, v2 in constraints:
+            i, j = self.index[v1], self.index[v2]
+            if i != j:
+                neighbor_sets[i].add(j)
+                neighbor_sets[j].add(i)
+        self.neighbors = [sorted(neighbors) for neighbors in neighbor_sets]
+
+    def initial_domains(self):
+        """Every value for every variable, as a list of bitmasks indexed by variable."""
+        return [(1 << len(self.values)) - 1] * len(self.variables)
+
+    def decode(self, assignment):
+        """Turn a dict of variable index -> value index into a dict of names, in assignment order."""
+        return {self.variables[var]: self.values[value] for var, value in assignment.items()}
+
+def domain_values(domain):
+    """Value indices in a domain bitmask, lowest first."""
+    while domain:
+        bit = domain & -domain
+        yield bit.bit_length() - 1
+        domain ^= bit
\ No newline at end of file
@@ -0,0 +1,205 @@
+# External-memory BFS: BFS layers are kept on disk as sorted files of cell ids
+#
+# Same moves and cell rules as bfs in BFS_and_DFS.py. Cell (x, y) is stored
+# as the 8-byte integer x * cols + y. To build layer k+1, the code streams
+# layer k and spills the neighbours of its cells to sorted run files. It
+# then merges those runs, drops duplicates, and subtracts layers k and k-1
+# by merging against their files. On an undirected grid that is enough to
+# get exactly the unvisited cells. All file I/O is done in large sequential
+# blocks.
+
+import heapq
+import os
+import tempfile
+from array import array
+
+from BFS_and_DFS import maze, start, goal
+
+ITEM_SIZE = array('q').itemsize
+
+class IOCounter:
+    """Running totals of the bytes and files the search moved through disk."""
+
+    def __init__(self):
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.files_written = 0
+
+    def as_dict(self):
+        return {"bytes_read": self.bytes_read, "bytes_written": self.bytes_written,
+                "files_written": self.files_written}
+
+class SortedFileWriter:
+    """Buffered writer of an ascending sequence of cell ids."""
+
+    def __init__(self, path, io, block_size):
+        self.path = path
+        self.io = io
+        self.block_size = block_size
+        self.file = open(path, 'wb')
+        self.buffer = array('q')
+        self.count = 0
+        io.files_written += 1
+
+    def write(self, value):
+        self.buffer.append(value)
+        self.count += 1
+        if len(self.buffer) >= self.block_size:
+            self.flush()
+
+    def flush(self):
+        self.buffer.tofile(self.file)
+        self.io.bytes_written += len(self.buffer) * ITEM_SIZE
+        self.buffer = array('q')
+
+    def close(self):
+        self.flush()
+        self.file.close()
+        return self.count
+
+def read_sorted_file(path, io, block_size):
+    """Stream the cell ids of a file in block_size chunks."""
+    with open(path, 'rb') as file:
+        while True:
+            block = array('q')
+            block.frombytes(file.read(block_size * ITEM_SIZE))
+            if not block:
+                return
+            io.bytes_read += len(block) * ITEM_SIZE
+            yield from block
+
+def neighbours(cell, maze, cols):
+    """Open cells one move away from a cell id, using the bfs move order."""
+    x, y = divmod(cell, cols)
+    for dx, dy in [(0,1), (1,0), (0,-1), (-1,0)]:
+        nx, ny = x+dx, y+dy
+        if 0 <= nx < len(maze) and 0 <= ny < cols and maze[nx][ny] == 0:
+            yield nx * cols + ny
+
+def spill_neighbour_runs(layer_path, maze, cols, workdir, depth, io, run_size, block_size):
+    """Write the neighbours of a layer as sorted, deduplicated run files."""
+    run_paths = []
+    buffer = set()
+
+    def spill():
+        path = os.path.join(workdir, f"run_{depth}_{len(run_paths)}.bin")
+        writer = SortedFileWriter(path, io, block_size)
+        for cell in sorted(buffer):
+            writer.write(cell)
+        writer.close()
+        run_paths.append(path)
+        buffer.clear()
+
+    for cell in read_sorted_file(layer_path, io, block_size):
+        buffer.update(neighbours(cell, maze, cols))
+        if len(buffer) >= run_size:
+            spill()
+    if buffer:
+        spill()
+    return run_paths
+
+def subtract_sorted(values, *excluded):
+    """Yield the items of an ascending stream that do not occur in any excluded ascending stream."""
+    heads = [next(stream, None) for stream in excluded]
+    for value in values:
+        for i, stream in enumerate(excluded):
+            while heads[i] is not None and heads[i] < value:
+                heads[i] = next(stream, None)
+        if all(head != value for head in heads):
+            yield value
+
+def unique_sorted(values):
+    """Drop consecutive duplicates from an ascending stream."""
+    last = None
+    for value in values:
+        if value != last:
+            yield value
+            last = value
+
+def external_bfs(maze, start, goal=None, workdir=None, run_size=1 << 20, block_size=1 << 16):
+    """
+    Perform BFS with every frontier layer stored on disk.
+
+    Args:
+        - maze: 2D list where 0 is open and 1 is a wall
+        - start: tuple (row, col) of start position
+        - goal: tuple (row, col) to find a shortest path to; None explores
+          everything reachable from start
+        - workdir: directory for layer and run files (default: a temporary one)
+        - run_size: maximum number of cell ids sorted in memory per run file
+        - block_size: number of cell ids per sequential read or write
+
+    Returns:
+        - tuple (path, stats): path is the list of positions from start to goal
+          (None if no goal was given or it is unreachable); stats holds the
+          layer sizes, goal distance and I/O volume, and without a goal also
+          the reached cell count and the eccentricity of start
+    """
+    cols = len(maze[0])
+    io = IOCounter()
+    temporary = tempfile.TemporaryDirectory() if workdir is None else None
+    workdir = temporary.name if temporary else workdir
+    goal_id = None if goal is None else goal[0] * cols + goal[1]
+
+    def layer_path(depth):
+        return os.path.join(workdir, f"layer_{depth}.bin")
+
+    try:
+        start_id = start[0] * cols + start[1]
+        writer = SortedFileWriter(layer_path(0), io, block_size)
+        writer.write(start_id)
+        layer_sizes = [writer.close()]
+        distance = 0 if start_id == goal_id else None
+
+        while distance is None and layer_sizes[-1]:
+            depth = len(layer_sizes) - 1
+            run_paths = spill_neighbour_runs(layer_path(depth), maze, cols, workdir, depth, io,
+                                             run_size, block_size)
+            merged = unique_sorted(heapq.merge(*(read_sorted_file(path, io, block_size) for path in run_paths)))
+            previous_layers = [read_sorted_file(layer_path(d), io, block_size) for d in (depth, depth - 1) if d >= 0]
+            writer = SortedFileWriter(layer_path(depth + 1), io, block_size)
+            for cell in subtract_sorted(merged, *previous_layers):
+                writer.write(cell)
+                if cell == goal_id:
+                    distance = depth + 1
+            layer_sizes.append(writer.close())
+            for stream in previous_layers:
+                stream.close()
+            for path in run_paths:
+                os.remove(path)
+            # Without a goal no path is rebuilt, so only the last two layers are needed
+            if goal_id is None and depth >= 1:
+                os.remove(layer_path(depth - 1))
+
+        if layer_sizes[-1] == 0:
+            layer_sizes.pop()
+        stats = {"layer_sizes": layer_sizes, "distance": distance}
+        if goal_id is None:
+            # A search for a goal stops at its layer, so only a full sweep measures these
+            stats["reached"] = sum(layer_sizes)
+            stats["eccentricity"] = len(layer_sizes) - 1
+
+        path = None
+        if distance is not None:
+            # Walk back one layer at a time, streaming each layer for a neighbour
+            cell = goal_id
+            cells = [cell]
+            for depth in range(distance - 1, -1, -1):
+                targets = set(neighbours(cell, maze, cols))
+                cell = next(c for c in read_sorted_file(layer_path(depth), io, block_size) if c in targets)
+                cells.append(cell)
+            path = [divmod(cell, cols) for cell in reversed(cells)]
+        stats["io"] = io.as_dict()
+        return path, stats
+    finally:
+        if temporary:
+            temporary.cleanup()
+
+if __name__ == "__main__":
+    # Example usage
+    path, stats = external_bfs(maze, start, goal, run_size=4, block_size=4)
+    print("External BFS Path:", path)
+    print("Stats:", stats)
+
+    _, stats = external_bfs(maze, start)
+    print("Reachable from start:", stats["reached"], "cells in", len(stats["layer_sizes"]), "layers")
\ No newline at end of file
@@ -10,7 +10,8 @@ maze = [
 start = (0, 0)
 goal = (4, 4)
 
-from heapq import heappush, heappop
+from Indexed_Priority_Queue import IndexedPriorityQueue
+from Search_Stepper import run_to_completion
 
 def is_valid(row, col):
     """Check if the position is within bounds and is an open path (0)."""
@@ -20,44 +21,79 @@ def manhattan_distance(pos1, pos2):
     """Calculate Manhattan distance between two positions."""
     return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
 
-def greedy_best_first_search(start, goal):
+def reconstruct_path(came_from, current):
+    """Follow predecessor links back from current to the start position."""
+    path = [current]
+    while current in came_from:
+        current = came_from[current]
+        path.append(current)
+    path.reverse()
+    return path
+
+def greedy_best_first_search_steps(start, goal, nodes_per_step=100):
     """
-    Perform Greedy Best-First Search to find a path from start to goal.
+    Perform Greedy Best-First Search as a generator that yields control every nodes_per_step expansions.
     
     Args:
         - start: tuple (row, col) of start position
         - goal: tuple (row, col) of goal position
+        - nodes_per_step: maximum number of nodes to expand before yielding
+    
+    Yields:
+        - int: number of nodes expanded since the previous yield
     
     Returns:
-        - list of positions representing the path if found, else None
+        - the result of greedy_best_first_search, as the generator's completion value
     """
-    # Priority queue to store (heuristic, current_position, path)
-    queue = [(manhattan_distance(start, goal), start, [start])]
+    if nodes_per_step < 1:
+        raise ValueError(f"nodes_per_step must be at least 1, got {nodes_per_step}")
+    # Indexed priority queue keyed by position with heuristic priority (one entry per open node)
+    queue = IndexedPriorityQueue()
+    queue.push(start, manhattan_distance(start, goal))
     visited = set()
+    came_from = {}
     
     directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Up, down, left, right
     
+    expanded = 0
     while queue:
-        _, current, path = heappop(queue)
+        if expanded == nodes_per_step:
+            yield expanded
+            expanded = 0
+        current, _ = queue.pop()
+        expanded += 1
         row, col = current
         
         if current == goal:
-            return path
-        
-        if current in visited:
-            continue
+            yield expanded
+            return reconstruct_path(came_from, current)
         
         visited.add(current)
         
         for dr, dc in directions:
             nr, nc = row + dr, col + dc
             next_pos = (nr, nc)
-            if is_valid(nr, nc) and next_pos not in visited:
-                new_path = path + [next_pos]
-                heappush(queue, (manhattan_distance(next_pos, goal), next_pos, new_path))
+            # The heuristic of a position never changes, so each node is queued once
+            if is_valid(nr, nc) and next_pos not in visited and next_pos not in queue:
+                came_from[next_pos] = current
+                queue.push(next_pos, manhattan_distance(next_pos, goal))
     
+    yield expanded
     return None
 
+def greedy_best_first_search(start, goal):
+    """
+    Perform Greedy Best-First Search to find a path from start to goal.
+    
+    Args:
+        - start: tuple (row, col) of start position
+        - goal: tuple (row, col) of goal position
+    
+    Returns:
+        - list of positions representing the path if found, else None
+    """
+    return run_to_completion(greedy_best_first_search_steps(start, goal))
+
 # Example usage
 result_path = greedy_best_first_search(start, goal)
 
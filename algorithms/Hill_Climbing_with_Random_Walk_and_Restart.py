@@ -1,106 +1,56 @@
-import random
+from Local_Search import random_walk_descent
+from Local_Search_Problems import NQueensProblem
 
-def calculate_conflicts(board):
+def hill_climbing_with_random_walk(n, random_walk_prob=0.1, max_steps=1000, greedy="best", sample_size=32):
     """
-    Calculate the number of conflicts (attacking pairs) in the current board configuration.
+    Run one Hill Climbing attempt with random walk from a random board.
     
     Args:
-        - board: list where index is row, value is column of the queen
+        - n: size of the board (N x N)
+        - random_walk_prob: probability of making a random move instead of a greedy move
+        - max_steps: maximum steps before giving up
+        - greedy: "best" scans all moves; "first" and "sampled" score sample_size random moves (see random_walk_descent)
+        - sample_size: random moves scored per greedy step for "first" and "sampled"
     
     Returns:
-        - int: number of conflicting pairs
-    """
-    n = len(board)
-    conflicts = 0
-    for i in range(n):
-        for j in range(i + 1, n):
-            # Same column or diagonal
-            if board[i] == board[j] or abs(board[i] - board[j]) == j - i:
-                conflicts += 1
-    return conflicts
-
-def get_neighbors(board):
+        - list representing the board if solution found, else None
     """
-    Generate all possible neighbors by moving one queen to a different column in its row.
+    # Start from a random board; the search itself is shared with other problems
+    board, conflicts = random_walk_descent(NQueensProblem(n), random_walk_prob, max_steps,
+                                           greedy=greedy, sample_size=sample_size)
     
-    Args:
-        - board: current board configuration
-    
-    Returns:
-        - list of new board configurations
-    """
-    n = len(board)
-    neighbors = []
-    for row in range(n):
-        current_col = board[row]
-        for new_col in range(n):
-            if new_col != current_col:
-                new_board = board[:]
-                new_board[row] = new_col
-                neighbors.append(new_board)
-    return neighbors
+    # If a solution is found (no conflicts), return it
+    return board.tolist() if conflicts == 0 else None
 
-def hill_climbing_with_random_walk_and_restart(n, random_walk_prob=0.1, max_restarts=100, max_steps=1000):
+def hill_climbing_with_random_walk_and_restart(n, random_walk_prob=0.1, max_restarts=100, max_steps=1000,
+                                               greedy="best", sample_size=32):
     """
     Perform Hill Climbing with random walk and random restarts to solve the N-Queens problem.
     
     Args:
         - n: size of the board (N x N)
-        - random_walk_prob: probability of making a random move instead of the best move
+        - random_walk_prob: probability of making a random move instead of a greedy move
         - max_restarts: maximum number of random restarts
         - max_steps: maximum steps per restart before giving up
+        - greedy: "best", "first" or "sampled" greedy step (see random_walk_descent)
+        - sample_size: random moves scored per greedy step for "first" and "sampled"
     
     Returns:
         - list representing the board if solution found, else None
     """
     for restart in range(max_restarts):
-        # Initialize a random board
-        current_board = list(range(n))
-        random.shuffle(current_board)
-        current_conflicts = calculate_conflicts(current_board)
-        
-        step = 0
-        while current_conflicts > 0 and step < max_steps:
-            neighbors = get_neighbors(current_board)
-            if not neighbors:
-                break
-            
-            # Random walk: with probability random_walk_prob, pick a random neighbor
-            if random.random() < random_walk_prob:
-                current_board = random.choice(neighbors)
-                current_conflicts = calculate_conflicts(current_board)
-            else:
-                # Standard Hill Climbing: pick the neighbor with the fewest conflicts
-                best_neighbor = None
-                best_conflicts = float('inf')
-                
-                for neighbor in neighbors:
-                    neigh_conflicts = calculate_conflicts(neighbor)
-                    if neigh_conflicts < best_conflicts:
-                        best_conflicts = neigh_conflicts
-                        best_neighbor = neighbor
-                
-                # If no better neighbor, break (stuck in local minimum)
-                if best_conflicts >= current_conflicts:
-                    break
-                
-                # Move to the best neighbor
-                current_board = best_neighbor
-                current_conflicts = best_conflicts
-            
-            step += 1
-        
-        # If a solution is found (no conflicts), return it
-        if current_conflicts == 0:
-            return current_board
+        solution = hill_climbing_with_random_walk(n, random_walk_prob, max_steps, greedy, sample_size)
+        if solution:
+            return solution
     
     return None
 
-# Example usage
-n = 8  # For 8-Queens
-solution = hill_climbing_with_random_walk_and_restart(n)
+if __name__ == "__main__":
+    # Example usage
+    n = 8  # For 8-Queens
+    solution = hill_climbing_with_random_walk_and_restart(n)
 
-if solution:
-    print("Solution found:", solution)
-else:
-    print("No solution found (local minimum). Try restarting.")
\ No newline at end of file
+    if solution:
+        print("Solution found:", solution)
+    else:
+        print("No solution found (local minimum). Try restarting.")
\ No newline at end of file
@@ -0,0 +1,114 @@
+# Indexed binary heap with decrease-key, shared by the grid searches
+
+class IndexedPriorityQueue:
+    """
+    Array-backed binary min-heap with a position map.
+
+    Each item appears in the heap at most once, so lowering the priority of an
+    item already in the queue moves it in place instead of pushing a duplicate.
+    Ties on priority are broken by comparing the items themselves, matching the
+    (priority, item, ...) tuple ordering the searches used with heapq.
+    """
+
+    def __init__(self):
+        self.heap = []       # list of [priority, item]
+        self.position = {}   # item -> index in heap
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __bool__(self):
+        return bool(self.heap)
+
+    def __contains__(self, item):
+        return item in self.position
+
+    def peek(self):
+        """
+        Return the item with the smallest priority without removing it.
+
+        Returns:
+            - tuple (item, priority)
+        """
+        return self.heap[0][1], self.heap[0][0]
+
+    def priority(self, item):
+        """Return the current priority of an item in the queue."""
+        return self.heap[self.position[item]][0]
+
+    def push(self, item, priority):
+        """
+        Insert an item, or lower its priority if it is already queued.
+
+        Args:
+            - item: hashable, comparable item (e.g. a (row, col) tuple)
+            - priority: priority value, smaller pops first
+
+        Returns:
+            - bool: True if the item was inserted or its priority decreased
+        """
+        if item in self.position:
+            return self.decrease_key(item, priority)
+        self.heap.append([priority, item])
+        self.position[item] = len(self.heap) - 1
+        self._sift_up(len(self.heap) - 1)
+        return True
+
+    def decrease_key(self, item, priority):
+        """Lower the priority of a queued item; larger priorities are ignored."""
+        index = self.position[item]
+        if priority >= self.heap[index][0]:
+            return False
+        self.heap[index][0] = priority
+        self._sift_up(index)
+        return True
+
+    def pop(self):
+        """
+        Remove and return the item with the smallest priority.
+
+        Returns:
+            - tuple (item, priority)
+        """
+        heap = self.heap
+        last = heap.pop()
+        if not heap:
+            del self.position[last[1]]
+            return last[1], last[0]
+        top = heap[0]
+        heap[0] = last
+        self.position[last[1]] = 0
+        del self.position[top[1]]
+        self._sift_down(0)
+        return top[1], top[0]
+
+    def _sift_up(self, index):
+        heap, position = self.heap, self.position
+        entry = heap[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            if heap[parent] <= entry:
+                break
+            heap[index] = heap[parent]
+            position[heap[index][1]] = index
+            index = parent
+        heap[index] = entry
+        position[entry[1]] = index
+
+    def _sift_down(self, index):
+        heap, position = self.heap, self.position
+        size = len(heap)
+        entry = heap[index]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            if entry <= heap[child]:
+                break
+            heap[index] = heap[child]
+            position[heap[index][1]] = index
+            index = child
+        heap[index] = entry
+        position[entry[1]] = index
\ No newline at end of file
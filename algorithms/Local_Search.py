@@ -0,0 +1,237 @@
+# Local search strategies that run on any problem with delta evaluation
+#
+# A problem object holds one candidate solution, changes it in place and
+# provides:
+#   cost                  current cost (lower is better)
+#   target                cost at which the search stops (None: use the whole budget)
+#   randomize(rng)        start over from a random solution
+#   random_move(rng)      a random neighbouring move, or None if there is none
+#   moves()               every neighbouring move
+#   delta(move)           cost change of a move without making it (O(1) or O(k))
+#   apply(move)           make the move and update cost
+#   move_attributes(move) (removed, added) solution features, for the tabu list
+#   solution()            copy of the current solution
+# and optionally:
+#   best_move()           (delta, move) of the lowest-delta move, for problems
+#                         that can score their whole neighbourhood faster than
+#                         one delta call per move
+#
+# Problem adapters for N-Queens, graph colouring/timetabling and TSP 2-opt
+# live in Local_Search_Problems.py.
+
+import math
+import random
+
+def best_move(problem):
+    """
+    Find the lowest-delta move of the current solution.
+
+    Returns:
+        - tuple (delta, move), or None if the neighbourhood is empty
+    """
+    if hasattr(problem, "best_move"):
+        return problem.best_move()
+    best = None
+    for move in problem.moves():
+        delta = problem.delta(move)
+        if best is None or delta < best[0]:
+            best = (delta, move)
+    return best
+
+def sampled_move(problem, sample_size, rng=random, first_improvement=False):
+    """
+    Score sample_size random moves instead of the whole neighbourhood.
+
+    Args:
+        - problem: problem object
+        - sample_size: number of random moves drawn
+        - rng: random number source
+        - first_improvement: return the first move that lowers the cost instead of the best of the sample
+
+    Returns:
+        - tuple (delta, move) of the chosen move, or None if the neighbourhood is empty
+    """
+    best = None
+    for _ in range(sample_size):
+        move = problem.random_move(rng)
+        if move is None:
+            break
+        delta = problem.delta(move)
+        if best is None or delta < best[0]:
+            best = (delta, move)
+            if first_improvement and delta < 0:
+                break
+    return best
+
+def is_solved(problem):
+    return problem.target is not None and problem.cost <= problem.target
+
+def steepest_descent(problem, max_steps=None):
+    """
+    Hill Climbing: make the best move until no move lowers the cost.
+
+    Args:
+        - problem: problem object, starting from its current solution
+        - max_steps: maximum number of moves (None: no limit)
+
+    Returns:
+        - tuple (solution, cost) of the final solution
+    """
+    step = 0
+    while not is_solved(problem) and (max_steps is None or step < max_steps):
+        move = best_move(problem)
+        # If no better neighbor, stuck in local minimum
+        if move is None or move[0] >= 0:
+            break
+        problem.apply(move[1])
+        step += 1
+    return problem.solution(), problem.cost
+
+def random_walk_descent(problem, random_walk_prob=0.1, max_steps=1000, rng=random, greedy="best", sample_size=32):
+    """
+    Hill Climbing with random walk: with probability random_walk_prob make a
+    random move, otherwise a greedy move.
+
+    The random move is drawn directly in O(1). The greedy move depends on greedy:
+        "best"    - the best move of the whole neighbourhood; the walk stops in
+                    a local minimum
+        "first"   - the first improving move among up to sample_size random moves
+        "sampled" - the best of sample_size random moves
+    A sampled greedy step costs O(sample_size) instead of a neighbourhood scan.
+    A sample without an improving move proves nothing, so it uses up the step
+    and the walk continues.
+
+    Args:
+        - problem: problem object, starting from its current solution
+        - random_walk_prob: probability of making a random move instead of a greedy move
+        - max_steps: maximum number of steps
+        - rng: random number source
+        - greedy: "best", "first" or "sampled"
+        - sample_size: random moves scored per greedy step for "first" and "sampled"
+
+    Returns:
+        - tuple (solution, cost) of the final solution
+    """
+    if greedy not in ("best", "first", "sampled"):
+        raise ValueError(f"Unknown greedy strategy: {greedy}")
+    step = 0
+    while not is_solved(problem) and step < max_steps:
+        if rng.random() < random_walk_prob:
+            move = problem.random_move(rng)
+            # No neighbours: there is nothing to walk to
+            if move is None:
+                break
+            problem.apply(move)
+        elif greedy == "best":
+            move = best_move(problem)
+            if move is None or move[0] >= 0:
+                break
+            problem.apply(move[1])
+        else:
+            move = sampled_move(problem, sample_size, rng, first_improvement=greedy == "first")
+            if move is None:
+                break
+            if move[0] < 0:
+                problem.apply(move[1])
+        step += 1
+    return problem.solution(), problem.cost
+
+def annealing(problem, initial_temp=1000, cooling_rate=0.95, max_iterations=10000, min_temp=0.1, rng=random):
+    """
+    Simulated Annealing with geometric cooling.
+
+    Args:
+        - problem: problem object, starting from its current solution
+        - initial_temp: starting temperature
+        - cooling_rate: factor by which temperature decreases each iteration
+        - max_iterations: maximum number of iterations
+        - min_temp: temperature at which the search stops
+        - rng: random number source
+
+    Returns:
+        - tuple (solution, cost) of the best solution seen
+    """
+    best_solution = problem.solution()
+    best_cost = problem.cost
+    temperature = initial_temp
+    iteration = 0
+    while temperature > min_temp and iteration < max_iterations and not is_solved(problem):
+        move = problem.random_move(rng)
+        if move is None:
+            break
+        delta = problem.delta(move)
+        # Accept the neighbor if better or with a probability based on temperature
+        if delta <= 0 or rng.random() < math.exp(-delta / temperature):
+            problem.apply(move)
+            if problem.cost < best_cost:
+                best_solution = problem.solution()
+                best_cost = problem.cost
+        temperature *= cooling_rate
+        iteration += 1
+    return best_solution, best_cost
+
+def tabu_walk(problem, max_iterations=1000, tenure=50):
+    """
+    Tabu Search: always make the best move whose added features were not
+    removed in the last tenure iterations. A tabu move is still allowed when
+    it gives a new best cost (aspiration).
+
+    Args:
+        - problem: problem object, starting from its current solution
+        - max_iterations: maximum number of iterations
+        - tenure: number of iterations a removed feature stays tabu
+
+    Returns:
+        - tuple (solution, cost) of the best solution seen
+    """
+    tabu_until = {}  # feature -> iteration at which it may be added again
+    best_solution = problem.solution()
+    best_cost = problem.cost
+    for iteration in range(max_iterations):
+        if is_solved(problem):
+            break
+        chosen = None
+        for move in problem.moves():
+            delta = problem.delta(move)
+            if chosen is not None and delta >= chosen[0]:
+                continue
+            _, added = problem.move_attributes(move)
+            tabu = any(tabu_until.get(feature, 0) > iteration for feature in added)
+            if not tabu or problem.cost + delta < best_cost:
+                chosen = (delta, move)
+        # If every move is tabu, stop
+        if chosen is None:
+            break
+        removed, _ = problem.move_attributes(chosen[1])
+        problem.apply(chosen[1])
+        for feature in removed:
+            tabu_until[feature] = iteration + 1 + tenure
+        if problem.cost < best_cost:
+            best_solution = problem.solution()
+            best_cost = problem.cost
+    return best_solution, best_cost
+
+if __name__ == "__main__":
+    # Example usage: every strategy on every problem
+    from Local_Search_Problems import GraphColoringProblem, NQueensProblem, TwoOptTourProblem
+
+    def make_problems():
+        random.seed(0)
+        points = [(random.random(), random.random()) for _ in range(30)]
+        distances = [[math.dist(p, q) for q in points] for p in points]
+        courses = ['C1', 'C2', 'C3', 'C4', 'C5', 'C6']
+        clashes = [('C1', 'C2'), ('C1', 'C3'), ('C2', 'C3'), ('C3', 'C4'), ('C4', 'C5'), ('C5', 'C6'), ('C6', 'C1')]
+        return [("8-Queens", NQueensProblem(8)),
+                ("Timetabling", GraphColoringProblem(courses, ['T1', 'T2', 'T3'], clashes)),
+                ("TSP 2-opt", TwoOptTourProblem(distances))]
+
+    strategies = [("Hill Climbing", steepest_descent),
+                  ("Random Walk", random_walk_descent),
+                  ("Simulated Annealing", lambda problem: annealing(problem, initial_temp=2, cooling_rate=0.999)),
+                  ("Tabu Search", lambda problem: tabu_walk(problem, max_iterations=200, tenure=5))]
+    for strategy_name, strategy in strategies:
+        for problem_name, problem in make_problems():
+            problem.randomize(random)
+            start_cost = problem.cost
+            _, cost = strategy(problem)
+            print(f"{strategy_name} on {problem_name}: cost {start_cost:.4g} -> {cost:.4g}")
\ No newline at end of file
@@ -0,0 +1,233 @@
+# Benchmark harness for the N-Queens local searches
+#
+# Every solver is run on the same seeds for each board size, with seeds spread
+# over a process pool. Each run records whether it solved the board, its wall
+# time and the moves it made. Runs are grouped per (solver, n) and reported as
+# success rate, moves per second and a runtime distribution. Failed runs count
+# as infinitely slow, so a percentile that lands on a failure is reported as
+# None rather than flattering the solver. The JSON report is meant to be
+# stored and compared between versions. Memory is measured in one extra run
+# per (solver, n) under tracemalloc, which slows it too much to be timed.
+#
+# The solvers are the same code paths as hill_climbing,
+# hill_climbing_with_random_walk_and_restart, simulated_annealing and
+# tabu_search with their default settings, driven through their shared parts
+# so that moves can be counted and a run can be stopped at its time limit.
+# min_conflicts is included as the reference for large boards; its repair
+# runs in slices of moves so the deadline is checked between them.
+
+import json
+import multiprocessing
+import random
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+from Local_Search import annealing, random_walk_descent, steepest_descent
+from Local_Search_Problems import NQueensProblem
+from N_Queens_Conflicts import ConflictCounter, random_board
+from N_Queens_Min_Conflicts import greedy_initial_board, min_conflicts_repair
+from Search_Stats import percentile
+from Tabu_Search import TabuEngine
+
+# Largest n each solver is run at by default; beyond these a single move or
+# the solver's memory use is too large for a useful benchmark
+SIZE_LIMITS = {
+    "hill_climbing": 1000,
+    "random_walk_restart": 1000,
+    "simulated_annealing": 100000,
+    "tabu_search": 3000,
+    "min_conflicts": 100000,
+}
+
+class BudgetExceeded(Exception):
+    """Raised inside a run that reached its time limit."""
+
+class MoveCounter:
+    """Wraps a local-search problem, counting moves and enforcing a deadline."""
+
+    def __init__(self, problem, deadline):
+        self.problem = problem
+        self.deadline = deadline
+        self.moves = 0
+
+    def __getattr__(self, name):
+        return getattr(self.problem, name)
+
+    def apply(self, move):
+        if time.perf_counter() > self.deadline:
+            raise BudgetExceeded(self.moves)
+        self.moves += 1
+        self.problem.apply(move)
+
+def run_hill_climbing(n, deadline):
+    problem = MoveCounter(NQueensProblem(n), deadline)
+    board, conflicts = steepest_descent(problem)
+    return (board if conflicts == 0 else None), problem.moves
+
+def run_random_walk_restart(n, deadline, max_restarts=100):
+    problem = MoveCounter(NQueensProblem(n), deadline)
+    for _ in range(max_restarts):
+        board, conflicts = random_walk_descent(problem)
+        if conflicts == 0:
+            return board, problem.moves
+        problem.randomize(random)
+    return None, problem.moves
+
+def run_simulated_annealing(n, deadline):
+    problem = MoveCounter(NQueensProblem(n), deadline)
+    board, conflicts = annealing(problem)
+    return (board if conflicts == 0 else None), problem.moves
+
+def run_tabu_search(n, deadline, max_iterations=1000):
+    engine = TabuEngine(random_board(n))
+    while engine.iteration < max_iterations and engine.best_conflicts > 0:
+        if time.perf_counter() > deadline:
+            raise BudgetExceeded(engine.iteration)
+        if not engine.step():
+            break
+    return (engine.best_board if engine.best_conflicts == 0 else None), engine.iteration
+
+def run_min_conflicts(n, deadline, max_steps=100000, slice_steps=1000):
+    board = greedy_initial_board(n)
+    moves = 0
+    while moves < max_steps:
+        if time.perf_counter() > deadline:
+            raise BudgetExceeded(moves)
+        # The board is repaired in place, so each slice continues where the last one stopped
+        solution, made = min_conflicts_repair(board, min(slice_steps, max_steps - moves))
+        moves += made
+        if solution is not None:
+            return solution, moves
+    return None, moves
+
+SOLVERS = {
+    "hill_climbing": run_hill_climbing,
+    "random_walk_restart": run_random_walk_restart,
+    "simulated_annealing": run_simulated_annealing,
+    "tabu_search": run_tabu_search,
+    "min_conflicts": run_min_conflicts,
+}
+
+def benchmark_run(solver, n, seed, time_limit, trace_memory=False):
+    """
+    Worker entry point: one seeded run of one solver.
+
+    Returns:
+        - dict with solver, n, seed, solved, timed_out, seconds and moves;
+          with trace_memory, also peak_memory_bytes allocated during the run
+    """
+    random.seed(seed)
+    if trace_memory:
+        tracemalloc.start()
+    began = time.perf_counter()
+    timed_out = False
+    try:
+        solution, moves = SOLVERS[solver](n, began + time_limit)
+    except BudgetExceeded as exceeded:
+        solution, moves = None, exceeded.args[0]
+        timed_out = True
+    seconds = time.perf_counter() - began
+    result = {"solver": solver, "n": n, "seed": seed, "timed_out": timed_out, "seconds": seconds, "moves": moves}
+    if trace_memory:
+        result["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    # Check the answer outside the timed section
+    result["solved"] = solution is not None and len(solution) == n and ConflictCounter(solution).conflicts == 0
+    return result
+
+def summarize(runs, memory_runs=()):
+    """
+    Group runs by (solver, n) into success rates and runtime distributions.
+
+    Args:
+        - runs: timed run results
+        - memory_runs: traced run results whose peak memory is attached to the matching group
+
+    Returns:
+        - list of dicts, one per (solver, n), in the order first seen
+    """
+    groups = {}
+    for run in runs:
+        groups.setdefault((run["solver"], run["n"]), []).append(run)
+    peak_memory = {(run["solver"], run["n"]): run["peak_memory_bytes"] for run in memory_runs}
+    summaries = []
+    for (solver, n), group in groups.items():
+        solved_times = sorted(run["seconds"] for run in group if run["solved"])
+        # Failed runs sort after every success
+        times = solved_times + [float('inf')] * (len(group) - len(solved_times))
+        total_seconds = sum(run["seconds"] for run in group)
+
+        def quantile(fraction):
+            value = percentile(times, fraction)
+            return None if value == float('inf') else value
+
+        summaries.append({
+            "solver": solver,
+            "n": n,
+            "runs": len(group),
+            "success_rate": len(solved_times) / len(group),
+            "timeouts": sum(run["timed_out"] for run in group),
+            "median_seconds": quantile(0.5),
+            "p90_seconds": quantile(0.9),
+            "p99_seconds": quantile(0.99),
+            "runtime_distribution": {f"p{round(fraction * 100)}": quantile(fraction)
+                                     for fraction in (0.1, 0.25, 0.5, 0.75, 0.9, 1.0)},
+            "moves_per_second": sum(run["moves"] for run in group) / total_seconds if total_seconds else None,
+            "peak_memory_bytes": peak_memory.get((solver, n)),
+        })
+    return summaries
+
+def run_benchmark(solvers=None, sizes=(8, 100, 1000, 10000, 100000), seeds=20, workers=None,
+                  time_limit=10.0, base_seed=0, size_limits=SIZE_LIMITS):
+    """
+    Run every solver over the same seeds for each board size.
+
+    Args:
+        - solvers: names from SOLVERS (default: all)
+        - sizes: board sizes n
+        - seeds: number of seeded runs per (solver, n)
+        - workers: number of worker processes (default: one per CPU)
+        - time_limit: seconds after which a run is stopped and counted as failed
+        - base_seed: first seed; run i uses base_seed + i for every solver and size
+        - size_limits: dict of solver -> largest n to run it at
+
+    Returns:
+        - dict with the config, per-(solver, n) summaries and the individual runs
+    """
+    solvers = list(solvers or SOLVERS)
+    cases = [(solver, n) for solver in solvers for n in sizes if n <= size_limits.get(solver, n)]
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(workers, mp_context=context) as executor:
+        futures = [executor.submit(benchmark_run, solver, n, base_seed + i, time_limit)
+                   for solver, n in cases for i in range(seeds)]
+        memory_futures = [executor.submit(benchmark_run, solver, n, base_seed, time_limit, True)
+                          for solver, n in cases]
+        runs = [future.result() for future in futures]
+        memory_runs = [future.result() for future in memory_futures]
+    config = {"solvers": solvers, "sizes": list(sizes), "seeds": seeds, "time_limit": time_limit,
+              "base_seed": base_seed, "workers": workers or multiprocessing.cpu_count()}
+    return {"config": config, "summary": summarize(runs, memory_runs), "runs": runs}
+
+def format_summary(report):
+    """Fixed-width table of the summaries, one line per (solver, n)."""
+    def seconds(value):
+        return "-" if value is None else f"{value:.4f}"
+
+    lines = [f"{'solver':<20} {'n':>7} {'success':>8} {'median s':>10} {'p90 s':>10} {'p99 s':>10} "
+             f"{'moves/s':>10} {'peak MB':>8}"]
+    for row in report["summary"]:
+        rate = "-" if row["moves_per_second"] is None else f"{row['moves_per_second']:.0f}"
+        memory = "-" if row["peak_memory_bytes"] is None else f"{row['peak_memory_bytes'] / 1e6:.2f}"
+        lines.append(f"{row['solver']:<20} {row['n']:>7} {row['success_rate']:>8.0%} "
+                     f"{seconds(row['median_seconds']):>10} {seconds(row['p90_seconds']):>10} "
+                     f"{seconds(row['p99_seconds']):>10} {rate:>10} {memory:>8}")
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    # Example usage: a quick run; the report is saved for later comparison
+    report = run_benchmark(sizes=(8, 100), seeds=10, time_limit=5.0)
+    print(format_summary(report))
+    with open("local_search_benchmark.json", "w") as file:
+        json.dump(report, file, indent=2)
+    print("Report written to local_search_benchmark.json")
\ No newline at end of file
@@ -0,0 +1,205 @@
+# Problem adapters for the strategies in Local_Search.py
+
+from N_Queens_Conflicts import ConflictCounter, random_board
+
+class NQueensProblem:
+    """
+    N-Queens with one queen per row; a move (row, new_col) moves one queen
+    within its row and is scored in O(1) by a ConflictCounter.
+
+    Args:
+        - board: array or list where index is row, value is column (mutated
+          in place), or the board size n for a random permutation array
+    """
+
+    target = 0
+
+    def __init__(self, board):
+        if isinstance(board, int):
+            board = random_board(board)
+        self.counter = ConflictCounter(board)
+
+    @property
+    def board(self):
+        return self.counter.board
+
+    @property
+    def cost(self):
+        return self.counter.conflicts
+
+    def randomize(self, rng):
+        self.counter = ConflictCounter(random_board(self.counter.n, rng))
+
+    def random_move(self, rng):
+        n = self.counter.n
+        if n < 2:
+            return None
+        row = rng.randrange(n)
+        # Shift by 1..n-1 columns (wrapping) so every other column is equally likely
+        return row, (self.counter.board[row] + rng.randrange(1, n)) % n
+
+    def moves(self):
+        n = self.counter.n
+        for row, current_col in enumerate(self.counter.board):
+            for new_col in range(n):
+                if new_col != current_col:
+                    yield row, new_col
+
+    def delta(self, move):
+        return self.counter.delta(*move)
+
+    def apply(self, move):
+        self.counter.apply(*move)
+
+    def best_move(self):
+        # Scores all columns of a row at once
+        best = self.counter.best_move()
+        return None if best is None else (best[0], best[1:])
+
+    def move_attributes(self, move):
+        row, new_col = move
+        return [(row, self.counter.board[row])], [move]
+
+    def solution(self):
+        return self.counter.board[:]
+
+class GraphColoringProblem:
+    """
+    Graph colouring as local search: give every variable a value so that no
+    constrained pair shares one. Timetabling fits directly: courses are the
+    variables, timeslots the values and each clash a constraint.
+
+    Names are mapped to indices once. For every variable the problem keeps how
+    many neighbours hold each value, so a move (variable, value) is scored in
+    O(1) and applied in O(degree).
+
+    Args:
+        - variables: list of variable names
+        - values: list of values (colours, timeslots)
+        - constraints: list of (var1, var2) pairs that must differ
+    """
+
+    target = 0
+
+    def __init__(self, variables, values, constraints):
+        self.variables = list(variables)
+        self.values = list(values)
+        index = {var: i for i, var in enumerate(self.variables)}
+        self.neighbors = [[] for _ in self.variables]
+        for v1, v2 in constraints:
+            self.neighbors[index[v1]].append(index[v2])
+            self.neighbors[index[v2]].append(index[v1])
+        self.colors = [0] * len(self.variables)
+        self.count_neighbor_colors()
+
+    def count_neighbor_colors(self):
+        k = len(self.values)
+        self.neighbor_colors = [[0] * k for _ in self.variables]  # var -> value -> neighbours holding it
+        for var, neighbors in enumerate(self.neighbors):
+            for other in neighbors:
+                self.neighbor_colors[var][self.colors[other]] += 1
+        self.cost = sum(self.neighbor_colors[var][color] for var, color in enumerate(self.colors)) // 2
+
+    def randomize(self, rng):
+        k = len(self.values)
+        self.colors = [rng.randrange(k) for _ in self.variables]
+        self.count_neighbor_colors()
+
+    def random_move(self, rng):
+        if not self.variables or len(self.values) < 2:
+            return None
+        var = rng.randrange(len(self.variables))
+        return var, (self.colors[var] + rng.randrange(1, len(self.values))) % len(self.values)
+
+    def moves(self):
+        for var, color in enumerate(self.colors):
+            for value in range(len(self.values)):
+                if value != color:
+                    yield var, value
+
+    def delta(self, move):
+        var, value = move
+        counts = self.neighbor_colors[var]
+        return counts[value] - counts[self.colors[var]]
+
+    def apply(self, move):
+        var, value = move
+        self.cost += self.delta(move)
+        old = self.colors[var]
+        for other in self.neighbors[var]:
+            self.neighbor_colors[other][old] -= 1
+            self.neighbor_colors[other][value] += 1
+        self.colors[var] = value
+
+    def move_attributes(self, move):
+        var, value = move
+        return [(var, self.colors[var])], [move]
+
+    def solution(self):
+        """Current assignment as a dict of variable name -> value."""
+        return {var: self.values[color] for var, color in zip(self.variables, self.colors)}
+
+class TwoOptTourProblem:
+    """
+    Travelling salesman tour improved with 2-opt moves. Move (i, j) removes
+    edges (tour[i], tour[i+1]) and (tour[j], tour[j+1]) and reconnects the
+    tour by reversing tour[i+1..j]; it is scored in O(1) and applied in
+    O(j - i).
+
+    Args:
+        - distances: symmetric matrix of city-to-city distances
+    """
+
+    target = None  # No known optimum: strategies use their whole budget
+
+    def __init__(self, distances):
+        self.distances = distances
+        self.tour = list(range(len(distances)))
+        self.cost = self.tour_length()
+
+    def tour_length(self):
+        tour = self.tour
+        return sum(self.distances[tour[i - 1]][tour[i]] for i in range(len(tour)))
+
+    def randomize(self, rng):
+        rng.shuffle(self.tour)
+        self.cost = self.tour_length()
+
+    def random_move(self, rng):
+        n = len(self.tour)
+        # A 2-opt move needs two edges that share no city
+        if n < 4:
+            return None
+        while True:
+            i, j = sorted(rng.sample(range(n), 2))
+            if j - i >= 2 and not (i == 0 and j == n - 1):
+                return i, j
+
+    def moves(self):
+        n = len(self.tour)
+        for i in range(n - 2):
+            for j in range(i + 2, n if i > 0 else n - 1):
+                yield i, j
+
+    def endpoints(self, move):
+        i, j = move
+        tour = self.tour
+        return tour[i], tour[i + 1], tour[j], tour[(j + 1) % len(tour)]
+
+    def delta(self, move):
+        a, b, c, d = self.endpoints(move)
+        dist = self.distances
+        return dist[a][c] + dist[b][d] - dist[a][b] - dist[c][d]
+
+    def apply(self, move):
+        i, j = move
+        self.cost += self.delta(move)
+        self.tour[i + 1:j + 1] = reversed(self.tour[i + 1:j + 1])
+
+    def move_attributes(self, move):
+        a, b, c, d = self.endpoints(move)
+        edge = lambda x, y: (min(x, y), max(x, y))
+        return [edge(a, b), edge(c, d)], [edge(a, c), edge(b, d)]
+
+    def solution(self):
+        return self.tour[:]
\ No newline at end of file
@@ -1,99 +1,265 @@
 import random
-import math
+import os
+import tempfile
+import time
+from array import array
 
-def calculate_conflicts(board):
+from Local_Search import annealing
+from Local_Search_Problems import NQueensProblem
+from N_Queens_Conflicts import ConflictCounter, np, random_board
+from Search_Checkpoint import load_checkpoint, restore_rng, rng_state, save_checkpoint
+
+def simulated_annealing(n, initial_temp=1000, cooling_rate=0.95, max_iterations=10000):
     """
-    Calculate the number of conflicts (attacking pairs) in the current board configuration.
+    Perform Simulated Annealing to solve the N-Queens problem.
     
     Args:
-    - board: list where index is row, value is column of the queen
+    - n: size of the board (N x N)
+    - initial_temp: starting temperature
+    - cooling_rate: factor by which temperature decreases each iteration
+    - max_iterations: maximum number of iterations
     
     Returns:
-    - int: number of conflicting pairs
+    - list representing the board if solution found, else None
     """
-    n = len(board)
-    conflicts = 0
-    for i in range(n):
-        for j in range(i + 1, n):
-            # Same column or diagonal
-            if board[i] == board[j] or abs(board[i] - board[j]) == j - i:
-                conflicts += 1
-    return conflicts
+    
+    # Start from a random board; the search itself is shared with other problems
+    best_board, best_conflicts = annealing(NQueensProblem(n), initial_temp, cooling_rate, max_iterations)
+    return best_board.tolist() if best_conflicts == 0 else None
 
-def get_random_neighbor(board):
+def batched_simulated_annealing(n, schedule="iterations", initial_temp=1.0, final_temp=0.02, cooling_rate=0.9999,
+                                target_acceptance=(0.3, 0.0005), adapt_rate=0.05, reheat_after=None, reheat_factor=4.0,
+                                max_iterations=None, batch_size=512, seed=None, checkpoint_path=None,
+                                checkpoint_every=60.0, resume_from=None):
     """
-    Generate a random neighbor by moving one queen to a different column in its row.
+    Perform Simulated Annealing with batched random draws and an adaptive cooling schedule.
     
-    Args:
-    - board: current board configuration
+    Proposals (row, column shift) and acceptance thresholds are drawn a batch
+    at a time from a NumPy Generator; a move is accepted when its delta is at
+    most temperature * E with E exponential, which is the Metropolis test
+    without an exp call per move. While few moves are accepted, the deltas of
+    the rest of the batch are computed in bulk and the loop jumps straight to
+    the next accepted move; while many are accepted, moves are scored one by
+    one with the O(1) counter. The temperature is constant within a batch.
     
-    Returns:
-    - new board configuration
-    """
-    n = len(board)
-    new_board = board[:]
-    row = random.randint(0, n - 1)
-    current_col = new_board[row]
-    new_col = random.choice([col for col in range(n) if col is not current_col])
-    new_board[row] = new_col
-    return new_board
-
-def simulated_annealing(n, initial_temp=1000, cooling_rate=0.95, max_iterations=10000):
-    """
-    Perform Simulated Annealing to solve the N-Queens problem.
+    With checkpoint_path set, the run's settings and state (boards,
+    temperature, counters and generator state) are saved between batches,
+    at most every checkpoint_every seconds and once at the end, so a run cut
+    short can be continued with resume_batched_simulated_annealing. The saved
+    state is taken at batch boundaries, so the resumed run makes exactly the
+    moves the uninterrupted run would have made.
     
     Args:
     - n: size of the board (N x N)
-    - initial_temp: starting temperature
-    - cooling_rate: factor by which temperature decreases each iteration
-    - max_iterations: maximum number of iterations
+    - schedule: how the temperature changes after each batch:
+        "geometric"  - multiply by cooling_rate per iteration
+        "iterations" - fall geometrically from initial_temp to final_temp over max_iterations
+        "adaptive"   - steer the batch acceptance rate towards a target that falls
+                       geometrically from target_acceptance[0] to target_acceptance[1]
+    - initial_temp: starting temperature (also the ceiling for reheats)
+    - final_temp: lowest temperature used
+    - cooling_rate: per-iteration factor for the "geometric" schedule
+    - target_acceptance: (start, end) acceptance rates for the "adaptive" schedule
+    - adapt_rate: relative temperature change per batch for the "adaptive" schedule
+    - reheat_after: iterations without a new best board before reheating (None: never)
+    - reheat_factor: temperature multiplier applied when reheating
+    - max_iterations: maximum number of proposals (default 20000 * n)
+    - batch_size: proposals drawn at once
+    - seed: seed for the random generator
+    - checkpoint_path: file the run is checkpointed to (None: no checkpoints)
+    - checkpoint_every: minimum seconds between checkpoints
+    - resume_from: (state, arrays) of a checkpoint to continue from; used by
+      resume_batched_simulated_annealing
     
     Returns:
-    - list representing the board if solution found, else None
+    - tuple (solution, stats): solution is the board if found, else None;
+      stats holds iterations, accepted, accepted_per_second, reheats,
+      final temperature, best_conflicts, elapsed seconds (including the time
+      before a resume), checkpoints written and checkpoint_seconds spent
+      writing them
     """
+    max_iterations = max_iterations or 20000 * n
+    settings = {"n": n, "schedule": schedule, "initial_temp": initial_temp, "final_temp": final_temp,
+                "cooling_rate": cooling_rate, "target_acceptance": list(target_acceptance),
+                "adapt_rate": adapt_rate, "reheat_after": reheat_after, "reheat_factor": reheat_factor,
+                "max_iterations": max_iterations, "batch_size": batch_size}
+    if resume_from is None:
+        rng = random.Random(seed) if np is None else np.random.default_rng(seed)
+    else:
+        state, arrays = resume_from
+        rng = restore_rng(state["rng"])
+    # A run keeps the generator it started with, so a resumed run draws the same numbers
+    vectorized = not isinstance(rng, random.Random)
+    if not vectorized:
+        def draw(size, temperature):
+            return ([rng.randrange(n) for _ in range(size)], [rng.randrange(1, n) for _ in range(size)],
+                    [temperature * rng.expovariate(1.0) for _ in range(size)])
+    else:
+        def draw(size, temperature):
+            return (rng.integers(0, n, size), rng.integers(1, n, size),
+                    temperature * rng.standard_exponential(size))
     
-    # Initialize a random board
-    current_board = list(range(n))
-    random.shuffle(current_board)
-    current_conflicts = calculate_conflicts(current_board)
+    if resume_from is None:
+        # Initialize a random board
+        if not vectorized:
+            current_board = random_board(n, rng)
+        else:
+            current_board = array('i', rng.permutation(n).astype(np.int32).tobytes())
+        best_board = current_board[:]
+        last_improvement = 0
+        temperature = initial_temp
+        iteration = accepted = reheats = 0
+        acceptance = 1.0
+        previous_elapsed = 0.0
+    else:
+        current_board, best_board = arrays["board"], arrays["best_board"]
+        last_improvement = state["last_improvement"]
+        temperature = state["temperature"]
+        iteration, accepted, reheats = state["iteration"], state["accepted"], state["reheats"]
+        acceptance = state["acceptance"]
+        best_conflicts = state["best_conflicts"]
+        previous_elapsed = state["elapsed"]
+    counter = ConflictCounter(current_board)
+    if vectorized:
+        board_vector = np.array(current_board, dtype=np.int64)
+        columns, diagonals, anti_diagonals = counter.numpy_counters()
+    if resume_from is None:
+        best_conflicts = counter.conflicts
+    checkpoints = 0
+    checkpoint_seconds = 0.0
+    began = time.perf_counter() - previous_elapsed
+    last_checkpoint = time.perf_counter()
     
-    best_board = current_board[:]
-    best_conflicts = current_conflicts
+    def checkpoint():
+        nonlocal checkpoints, checkpoint_seconds, last_checkpoint
+        started = time.perf_counter()
+        saved = {"iteration": iteration, "accepted": accepted, "reheats": reheats, "acceptance": acceptance,
+                 "temperature": temperature, "last_improvement": last_improvement,
+                 "best_conflicts": best_conflicts, "elapsed": started - began, "rng": rng_state(rng)}
+        save_checkpoint(checkpoint_path, "batched_simulated_annealing", {"settings": settings, "state": saved},
+                        {"board": current_board, "best_board": best_board})
+        last_checkpoint = time.perf_counter()
+        checkpoints += 1
+        checkpoint_seconds += last_checkpoint - started
     
-    temperature = initial_temp
-    iteration = 0
-    
-    while temperature > 0.1 and iteration < max_iterations:
-        # Generate a random neighbor
-        neighbor = get_random_neighbor(current_board)
-        neighbor_conflicts = calculate_conflicts(neighbor)
-        
-        # Accept the neighbor if better or with a probability based on temperature
-        delta = neighbor_conflicts - current_conflicts
-        if delta <= 0 or random.random() < math.exp(-delta / temperature):
-            current_board = neighbor
-            current_conflicts = neighbor_conflicts
-            
-            # Update best solution if current is better
-            if current_conflicts < best_conflicts:
-                best_board = current_board[:]
-                best_conflicts = current_conflicts
+    while best_conflicts > 0 and iteration < max_iterations:
+        size = min(batch_size, max_iterations - iteration)
+        rows, shifts, limits = draw(size, temperature)
+        batch_accepted = 0
+        consumed = size  # proposals used; fewer when the board is solved mid-batch
+        if not vectorized or acceptance > 1 / 32:
+            # Busy phase: score moves one by one in O(1)
+            if vectorized:
+                rows, shifts, limits = rows.tolist(), shifts.tolist(), limits.tolist()
+            for proposal, (row, shift, limit) in enumerate(zip(rows, shifts, limits), 1):
+                new_col = (current_board[row] + shift) % n
+                if counter.delta(row, new_col) <= limit:
+                    counter.apply(row, new_col)
+                    if vectorized:
+                        board_vector[row] = new_col
+                    batch_accepted += 1
+                    if counter.conflicts < best_conflicts:
+                        best_board = current_board[:]
+                        best_conflicts = counter.conflicts
+                        last_improvement = iteration + proposal
+                        if best_conflicts == 0:
+                            consumed = proposal
+                            break
+        else:
+            # Quiet phase: score the batch in bulk, a window at a time, and jump to the
+            # next accepted move; the window covers a few expected gaps between acceptances
+            window = max(64, int(4 / acceptance) if acceptance else size)
+            start = 0
+            while start < size:
+                end = min(size, start + window)
+                batch_rows = rows[start:end]
+                old_cols = board_vector[batch_rows]
+                new_cols = (old_cols + shifts[start:end]) % n
+                deltas = (columns[new_cols] + diagonals[batch_rows + new_cols]
+                          + anti_diagonals[batch_rows - new_cols + n - 1]
+                          - columns[old_cols] - diagonals[batch_rows + old_cols]
+                          - anti_diagonals[batch_rows - old_cols + n - 1] + 3)
+                hits = np.flatnonzero(deltas <= limits[start:end])
+                if len(hits) == 0:
+                    start = end
+                    continue
+                index = int(hits[0])
+                row, new_col = int(batch_rows[index]), int(new_cols[index])
+                counter.apply(row, new_col)
+                board_vector[row] = new_col
+                batch_accepted += 1
+                start += index + 1
+                if counter.conflicts < best_conflicts:
+                    best_board = current_board[:]
+                    best_conflicts = counter.conflicts
+                    last_improvement = iteration + start
+                    if best_conflicts == 0:
+                        consumed = start
+                        break
+        iteration += consumed
+        accepted += batch_accepted
+        acceptance = batch_accepted / consumed
         
-        # Stop if a solution is found
-        if best_conflicts == 0:
-            return best_board
-        
-        # Cool down the temperature
-        temperature *= cooling_rate
-        iteration += 1
+        # Update the temperature for the next batch
+        if schedule == "geometric":
+            temperature *= cooling_rate ** consumed
+        elif schedule == "iterations":
+            temperature *= (final_temp / initial_temp) ** (consumed / max_iterations)
+        elif schedule == "adaptive":
+            start_rate, end_rate = target_acceptance
+            target = start_rate * (end_rate / start_rate) ** (iteration / max_iterations)
+            temperature *= (1 + adapt_rate) if acceptance < target else 1 / (1 + adapt_rate)
+        else:
+            raise ValueError(f"Unknown schedule: {schedule}")
+        if reheat_after and iteration - last_improvement >= reheat_after:
+            temperature *= reheat_factor
+            last_improvement = iteration
+            reheats += 1
+        temperature = min(initial_temp, max(final_temp, temperature))
+        if checkpoint_path and time.perf_counter() - last_checkpoint >= checkpoint_every:
+            checkpoint()
+    
+    if checkpoint_path:
+        checkpoint()
+    elapsed = time.perf_counter() - began
+    stats = {"iterations": iteration, "accepted": accepted,
+             "accepted_per_second": accepted / elapsed if elapsed else None, "reheats": reheats,
+             "temperature": temperature, "best_conflicts": best_conflicts, "elapsed": elapsed,
+             "checkpoints": checkpoints, "checkpoint_seconds": checkpoint_seconds}
+    return (best_board.tolist() if best_conflicts == 0 else None), stats
+
+def resume_batched_simulated_annealing(checkpoint_path, checkpoint_every=60.0):
+    """
+    Continue a batched_simulated_annealing run from its checkpoint, with the settings it was started with.
+    
+    Args:
+    - checkpoint_path: checkpoint written by the run; it keeps being updated
+    - checkpoint_every: minimum seconds between checkpoints
     
-    return best_board if best_conflicts == 0 else None
+    Returns:
+    - tuple (solution, stats) as returned by batched_simulated_annealing
+    """
+    header, arrays = load_checkpoint(checkpoint_path, "batched_simulated_annealing")
+    settings = header["settings"]
+    return batched_simulated_annealing(**settings, checkpoint_path=checkpoint_path, checkpoint_every=checkpoint_every,
+                                       resume_from=(header["state"], arrays))
+
+if __name__ == "__main__":
+    # Example usage
+    n = 8  # for 8-Queens
+    solution = simulated_annealing(n)
+
+    if solution:
+        print("Solution found:", solution)
+    else:
+        print("No solution found.")
 
-# Example usage
-n = 8  # for 8-Queens
-solution = simulated_annealing(n)
+    # Batched engine with adaptive cooling on a larger board
+    solution, stats = batched_simulated_annealing(200, schedule="adaptive", seed=1)
+    print("n=200:", "solved" if solution else "not solved", stats)
 
-if solution:
-    print("Solution found:", solution)
-else:
-    print("No solution found.")
\ No newline at end of file
+    # Checkpointed run; resume_batched_simulated_annealing(checkpoint_path) would continue it after a crash
+    checkpoint_path = os.path.join(tempfile.gettempdir(), "n_queens_annealing.ckpt")
+    solution, stats = batched_simulated_annealing(500, seed=1, checkpoint_path=checkpoint_path, checkpoint_every=0.5)
+    print(f"n=500: {'solved' if solution else 'not solved'}, {stats['checkpoints']} checkpoints took "
+          f"{stats['checkpoint_seconds']:.3f}s of {stats['elapsed']:.2f}s")
\ No newline at end of file
@@ -0,0 +1,165 @@
+# Exhaustive N-Queens backtracking with bitmasks
+#
+# Occupied columns and both diagonal directions are kept as int masks, where
+# bit c stands for column c in the current row. Moving to the next row shifts
+# the diagonal masks one place, so the free squares of a row are
+# ~(columns | left | right) restricted to n bits, and each placement is a few
+# integer operations. This is the exact baseline for the stochastic solvers:
+# it can list every solution or count them.
+#
+# Counting splits the tree on the queens of the first two rows and sends the
+# subtrees to a process pool. Reflecting a board left to right maps each
+# solution with the first queen in column c to one with it in column n-1-c,
+# so only first-row columns in the left half are searched and their counts
+# doubled. For odd n, the middle column of the first row is split again on
+# the second row, which cannot also be the middle column.
+
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+def count_completions(full, columns, left, right):
+    """
+    Count the ways to finish a board from one row's masks.
+
+    Args:
+        - full: mask with the low n bits set
+        - columns: columns already holding a queen
+        - left: squares of this row attacked along one diagonal direction
+        - right: squares of this row attacked along the other direction
+
+    Returns:
+        - int: number of completions
+    """
+    free = full & ~(columns | left | right)
+    count = 0
+    while free:
+        bit = free & -free
+        free ^= bit
+        rest = full ^ (columns | bit)
+        next_left = ((left | bit) << 1) & full
+        next_right = (right | bit) >> 1
+        if rest & (rest - 1):
+            count += count_completions(full, columns | bit, next_left, next_right)
+        elif not rest & (next_left | next_right):
+            # Board full, or one row left whose only open column is not attacked
+            count += 1
+    return count
+
+def place_rows(n, placement):
+    """
+    Masks after placing queens in the first rows.
+
+    Args:
+        - n: size of the board (N x N)
+        - placement: columns of the queens in the first rows
+
+    Returns:
+        - tuple (columns, left, right) for the next row, or None if two queens attack
+    """
+    full = (1 << n) - 1
+    columns = left = right = 0
+    for col in placement:
+        bit = 1 << col
+        if (columns | left | right) & bit:
+            return None
+        columns |= bit
+        left = ((left | bit) << 1) & full
+        right = (right | bit) >> 1
+    return columns, left, right
+
+def count_subtree(n, placement):
+    """Worker entry point: count the solutions that start with the given rows."""
+    masks = place_rows(n, placement)
+    if masks is None:
+        return 0
+    if len(placement) == n:
+        return 1
+    return count_completions((1 << n) - 1, *masks)
+
+def split_tasks(n):
+    """
+    Subtrees to search, with the factor each count is multiplied by.
+
+    Returns:
+        - list of (placement, weight) pairs covering every solution exactly once after weighting
+    """
+    if n < 2:
+        return [((), 1)]
+    tasks = []
+    for first in range(n // 2):
+        for second in range(n):
+            tasks.append(((first, second), 2))  # The mirror image starts in column n-1-first
+    if n % 2:
+        middle = n // 2
+        for second in range(middle):
+            tasks.append(((middle, second), 2))  # Mirror starts middle, n-1-second
+    return tasks
+
+def count_solutions(n, workers=None):
+    """
+    Count all N-Queens solutions with a process pool.
+
+    Args:
+        - n: size of the board (N x N)
+        - workers: number of worker processes (default: one per CPU)
+
+    Returns:
+        - int: number of solutions
+    """
+    tasks = split_tasks(n)
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(workers, mp_context=context) as executor:
+        counts = executor.map(count_subtree, [n] * len(tasks), [placement for placement, _ in tasks],
+                              chunksize=max(1, len(tasks) // (4 * (workers or multiprocessing.cpu_count()))))
+        return sum(count * weight for count, (_, weight) in zip(counts, tasks))
+
+def solutions(n):
+    """
+    Generate every N-Queens solution in lexicographic order, one at a time.
+
+    Args:
+        - n: size of the board (N x N)
+
+    Yields:
+        - list where index is row, value is column of the queen
+    """
+    full = (1 << n) - 1
+    board = []
+    # Each stack entry holds the free squares still to try in that row and the row's masks
+    stack = [(full, 0, 0, 0)]
+    while stack:
+        free, columns, left, right = stack.pop()
+        if not free:
+            if board:
+                board.pop()
+            continue
+        bit = free & -free
+        stack.append((free ^ bit, columns, left, right))
+        board.append(bit.bit_length() - 1)
+        next_columns = columns | bit
+        if next_columns == full:
+            yield board[:]
+            board.pop()
+            continue
+        next_left = ((left | bit) << 1) & full
+        next_right = (right | bit) >> 1
+        stack.append((full & ~(next_columns | next_left | next_right), next_columns, next_left, next_right))
+    return
+
+def first_solution(n):
+    """
+    Find the lexicographically first N-Queens solution.
+
+    Returns:
+        - list representing the board if solution found, else None
+    """
+    return next(solutions(n), None)
+
+if __name__ == "__main__":
+    # Example usage
+    print("First solution for n=8:", first_solution(8))
+    print("Solutions for n=6:", list(solutions(6)))
+    for n in (8, 12, 14):
+        began = time.perf_counter()
+        print(f"n={n}: {count_solutions(n)} solutions in {time.perf_counter() - began:.2f}s")
\ No newline at end of file
@@ -0,0 +1,184 @@
+# Conflict counting shared by the N-Queens local searches
+#
+# Boards are compact array('i') objects (4 bytes per queen) that the solvers
+# mutate in place; ConflictCounter.apply returns the column it replaced, which
+# is all that is needed to undo a move. Whole boards are copied only to keep a
+# new best, and solvers hand back a plain list at the end.
+
+import random
+import sys
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # Vectorized row scoring falls back to plain Python
+    np = None
+
+def random_board(n, rng=random):
+    """Random permutation board (no two queens share a column) as a compact array."""
+    board = array('i', range(n))
+    rng.shuffle(board)
+    return board
+
+def calculate_conflicts(board):
+    """
+    Calculate the number of conflicts (attacking pairs) in the current board configuration.
+
+    Args:
+        - board: list where index is row, value is column of the queen
+
+    Returns:
+        - int: number of conflicting pairs
+    """
+    n = len(board)
+    conflicts = 0
+    for i in range(n):
+        for j in range(i + 1, n):
+            # Same column or diagonal
+            if board[i] == board[j] or abs(board[i] - board[j]) == j - i:
+                conflicts += 1
+    return conflicts
+
+class ConflictCounter:
+    """
+    Incremental conflict evaluator for a board with one queen per row.
+
+    Keeps how many queens sit on every column, diagonal (row + col) and
+    anti-diagonal (row - col), so the conflict change of moving one queen is
+    found in O(1) and applying the move is O(1). The total always equals
+    calculate_conflicts(board): each line holding k queens adds k*(k-1)/2 pairs.
+    
+    The counters are array('i') objects like the board. When NumPy is
+    available, row_deltas and best_move score every column of a row with array
+    slices of mirrored counters; scalar delta/apply keep using the compact
+    arrays, which are faster for single lookups.
+
+    Args:
+        - board: array or list where index is row, value is column; mutated in place by apply
+    """
+
+    def __init__(self, board):
+        n = len(board)
+        self.board = board
+        self.n = n
+        self.columns = array('i', [0]) * n
+        self.diagonals = array('i', [0]) * (2 * n - 1)       # indexed by row + col
+        self.anti_diagonals = array('i', [0]) * (2 * n - 1)  # indexed by row - col + n - 1
+        for row, col in enumerate(board):
+            self.columns[col] += 1
+            self.diagonals[row + col] += 1
+            self.anti_diagonals[row - col + n - 1] += 1
+        self.conflicts = sum(k * (k - 1) // 2 for counts in (self.columns, self.diagonals, self.anti_diagonals)
+                             for k in counts)
+        self.vectors = None  # NumPy mirrors of the counters, built on first use
+
+    def memory_bytes(self):
+        """Bytes held by the board, the counters and (once built) their NumPy mirrors."""
+        total = sum(sys.getsizeof(values) for values in (self.board, self.columns, self.diagonals,
+                                                         self.anti_diagonals))
+        if self.vectors is not None:
+            total += sum(vector.nbytes for vector in self.vectors)
+        return total
+
+    def queen_conflicts(self, row):
+        """Number of other queens attacking the queen in the given row."""
+        col = self.board[row]
+        return (self.columns[col] + self.diagonals[row + col]
+                + self.anti_diagonals[row - col + self.n - 1] - 3)
+
+    def delta(self, row, new_col):
+        """
+        Change in total conflicts if the queen in row moved to new_col.
+
+        Args:
+            - row: row of the queen to move
+            - new_col: destination column (different from the current one)
+
+        Returns:
+            - int: new conflicts minus current conflicts
+        """
+        # The old and new squares share the row only, so their lines never overlap
+        added = (self.columns[new_col] + self.diagonals[row + new_col]
+                 + self.anti_diagonals[row - new_col + self.n - 1])
+        return added - self.queen_conflicts(row)
+
+    def apply(self, row, new_col):
+        """
+        Move the queen in row to new_col, updating the counters and total.
+
+        Returns:
+            - int: the column the queen came from (apply it again to undo)
+        """
+        n = self.n
+        old_col = self.board[row]
+        self.conflicts += self.delta(row, new_col)
+        self.columns[old_col] -= 1
+        self.diagonals[row + old_col] -= 1
+        self.anti_diagonals[row - old_col + n - 1] -= 1
+        self.columns[new_col] += 1
+        self.diagonals[row + new_col] += 1
+        self.anti_diagonals[row - new_col + n - 1] += 1
+        if self.vectors is not None:
+            columns, diagonals, anti_diagonals = self.vectors
+            columns[old_col] -= 1
+            diagonals[row + old_col] -= 1
+            anti_diagonals[row - old_col + n - 1] -= 1
+            columns[new_col] += 1
+            diagonals[row + new_col] += 1
+            anti_diagonals[row - new_col + n - 1] += 1
+        self.board[row] = new_col
+        return old_col
+
+    def numpy_counters(self):
+        """NumPy copies of (columns, diagonals, anti_diagonals), kept in sync by apply once built."""
+        if self.vectors is None:
+            self.vectors = tuple(np.array(counts, dtype=np.int64)
+                                 for counts in (self.columns, self.diagonals, self.anti_diagonals))
+        return self.vectors
+
+    def row_deltas(self, row):
+        """
+        Conflict deltas for moving the queen in row to each column.
+
+        Returns:
+            - NumPy array (or list without NumPy) indexed by column; the queen's
+              current column holds 3 * n, larger than any real delta
+        """
+        n = self.n
+        current = self.queen_conflicts(row)
+        if np is None:
+            deltas = [self.columns[col] + self.diagonals[row + col] + self.anti_diagonals[row - col + n - 1] - current
+                      for col in range(n)]
+        else:
+            columns, diagonals, anti_diagonals = self.numpy_counters()
+            # Column c lies on diagonal row + c and anti-diagonal row - c + n - 1
+            deltas = columns + diagonals[row:row + n] + anti_diagonals[row:row + n][::-1] - current
+        deltas[self.board[row]] = 3 * n
+        return deltas
+
+    def best_move(self, excluded=None):
+        """
+        Find the lowest-delta move without building any neighbor board.
+
+        Args:
+            - excluded: optional dict mapping row -> columns that may not be chosen
+
+        Returns:
+            - tuple (delta, row, new_col) for the first best move in row order,
+              or None if every move is excluded
+        """
+        n = self.n
+        best = None
+        for row in range(n):
+            deltas = self.row_deltas(row)
+            if excluded and row in excluded:
+                for col in excluded[row]:
+                    deltas[col] = 3 * n
+            if np is None:
+                col = min(range(n), key=deltas.__getitem__)
+            else:
+                col = int(deltas.argmin())
+            delta = int(deltas[col])
+            if delta < 3 * n and (best is None or delta < best[0]):
+                best = (delta, row, col)
+        return best
\ No newline at end of file
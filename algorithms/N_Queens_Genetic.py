@@ -0,0 +1,284 @@
+# Genetic algorithm for the N-Queens problem on a NumPy population matrix
+#
+# The population is one (size, n) integer matrix, one board per row in the
+# usual encoding (index is row, value is column of the queen). Every board is
+# a permutation, so no two queens share a column, and crossover and mutation
+# keep it that way. Fitness is calculate_conflicts for every board at once:
+# each queen's line index is offset by its board's number, so one bincount
+# per line family (columns, diagonals, anti-diagonals) counts the queens on
+# every line of every board.
+#
+# One generation is tournament selection, uniform order crossover and swap
+# mutation, each applied to the whole matrix with the best boards kept
+# unchanged (elitism). In the island model several populations evolve in
+# separate processes. Every migration_interval generations, each island sends
+# copies of its best boards to the next island in a ring, where they replace
+# the worst.
+
+import multiprocessing
+import time
+
+from N_Queens_Conflicts import calculate_conflicts, np
+
+def population_conflicts(population):
+    """
+    Number of attacking pairs of every board, as calculate_conflicts would count them.
+
+    Args:
+        - population: (size, n) integer matrix, one board per row
+
+    Returns:
+        - NumPy array of conflicts per board
+    """
+    size, n = population.shape
+    rows = np.arange(n)
+    boards = np.arange(size)[:, None]
+    conflicts = np.zeros(size, dtype=np.int64)
+    # Columns, diagonals (row + col) and anti-diagonals (row - col + n - 1)
+    for lines, width in ((population, n), (population + rows, 2 * n - 1), (rows - population + n - 1, 2 * n - 1)):
+        counts = np.bincount((lines + boards * width).ravel(), minlength=size * width).reshape(size, width)
+        conflicts += (counts * (counts - 1) // 2).sum(axis=1)
+    return conflicts
+
+def order_crossover(first, second, rng):
+    """
+    Uniform order crossover of two parent matrices.
+
+    Each child keeps the genes of its first parent at a random half of the
+    positions and fills the other positions with the missing columns in the
+    order they appear in its second parent, so every child is a permutation.
+
+    Args:
+        - first, second: (size, n) parent matrices
+        - rng: NumPy Generator
+
+    Returns:
+        - (size, n) child matrix
+    """
+    size, n = first.shape
+    keep = rng.random((size, n)) < 0.5
+    kept_columns = np.zeros((size, n), dtype=bool)
+    np.put_along_axis(kept_columns, first, keep, axis=1)
+    fill = ~np.take_along_axis(kept_columns, second, axis=1)
+    children = first.copy()
+    # Both masks select the same number of cells in every row, and boolean indexing walks rows in order
+    children[~keep] = second[fill]
+    return children
+
+class Population:
+    """
+    One population of permutation boards evolved a generation at a time.
+
+    Args:
+        - n: size of the board (N x N)
+        - size: number of boards
+        - rng: NumPy Generator
+        - tournament_size: boards compared to pick each parent
+        - crossover_rate: probability that a pair of parents is crossed
+        - mutation_rate: probability that a child gets one swap of two queens
+        - elite: best boards copied unchanged into the next generation
+    """
+
+    def __init__(self, n, size, rng, tournament_size=8, crossover_rate=0.9, mutation_rate=0.8, elite=2):
+        self.n = n
+        self.size = size
+        self.rng = rng
+        self.tournament_size = tournament_size
+        self.crossover_rate = crossover_rate
+        self.mutation_rate = mutation_rate
+        self.elite = elite
+        self.boards = rng.permuted(np.tile(np.arange(n), (size, 1)), axis=1)
+        self.fitness = population_conflicts(self.boards)
+        self.evaluations = size
+        self.generation = 0
+
+    def select(self, count):
+        """Tournament selection: the best of tournament_size random boards, count times."""
+        entrants = self.rng.integers(0, self.size, (count, self.tournament_size))
+        winners = np.take_along_axis(entrants, self.fitness[entrants].argmin(axis=1)[:, None], axis=1)[:, 0]
+        return self.boards[winners]
+
+    def step(self):
+        """Replace the population with the next generation."""
+        rng = self.rng
+        count = self.size - self.elite
+        first, second = self.select(count), self.select(count)
+        crossed = rng.random(count) < self.crossover_rate
+        children = np.where(crossed[:, None], order_crossover(first, second, rng), first)
+        mutated = np.flatnonzero(rng.random(count) < self.mutation_rate)
+        a = rng.integers(0, self.n, len(mutated))
+        b = rng.integers(0, self.n, len(mutated))
+        children[mutated, a], children[mutated, b] = children[mutated, b], children[mutated, a]
+        elite = np.argsort(self.fitness, kind='stable')[:self.elite]
+        self.boards = np.concatenate((self.boards[elite], children))
+        self.fitness = np.concatenate((self.fitness[elite], population_conflicts(children)))
+        self.evaluations += count
+        self.generation += 1
+
+    def best(self, count=1):
+        """The count best boards, best first."""
+        return self.boards[np.argsort(self.fitness, kind='stable')[:count]]
+
+    def best_conflicts(self):
+        return int(self.fitness.min())
+
+    def receive(self, migrants):
+        """Replace the worst boards with migrants."""
+        worst = np.argsort(self.fitness, kind='stable')[self.size - len(migrants):]
+        self.boards[worst] = migrants
+        self.fitness[worst] = population_conflicts(migrants)
+        self.evaluations += len(migrants)
+
+    def evolve(self, generations):
+        """
+        Run up to the given number of generations, stopping at a solution.
+
+        Returns:
+            - list representing the board if solution found, else None
+        """
+        for _ in range(generations):
+            if self.best_conflicts() == 0:
+                break
+            self.step()
+        return self.best()[0].tolist() if self.best_conflicts() == 0 else None
+
+def genetic_algorithm(n, population_size=200, max_generations=1000, tournament_size=8, crossover_rate=0.9,
+                      mutation_rate=0.8, elite=2, seed=None):
+    """
+    Solve the N-Queens problem with a single vectorized population.
+
+    Args:
+        - n: size of the board (N x N)
+        - population_size: number of boards
+        - max_generations: maximum number of generations
+        - tournament_size, crossover_rate, mutation_rate, elite: see Population
+        - seed: seed for the random generator
+
+    Returns:
+        - tuple (solution, stats): solution is the board if found, else None;
+          stats holds generations, evaluations, evaluations_per_second,
+          best_conflicts and elapsed seconds
+    """
+    if np is None:
+        raise ImportError("genetic_algorithm needs NumPy for its population matrix")
+    began = time.perf_counter()
+    population = Population(n, population_size, np.random.default_rng(seed), tournament_size, crossover_rate,
+                            mutation_rate, elite)
+    solution = population.evolve(max_generations)
+    elapsed = time.perf_counter() - began
+    stats = {"generations": population.generation, "evaluations": population.evaluations,
+             "evaluations_per_second": population.evaluations / elapsed if elapsed else None,
+             "best_conflicts": population.best_conflicts(), "elapsed": elapsed}
+    return solution, stats
+
+def island_worker(connection, n, settings, seed, migrant_count):
+    """
+    Worker loop: evolve one island between migrations.
+
+    Messages:
+        - ("run", generations, migrants or None) -> ("migrants", migrant_count best boards, best_conflicts, evaluations)
+          or ("solution", board, evaluations)
+        - ("stop",) ends the worker
+    """
+    population = Population(n, rng=np.random.default_rng(seed), **settings)
+    while True:
+        message = connection.recv()
+        if message[0] == "stop":
+            return
+        _, generations, migrants = message
+        if migrants is not None:
+            population.receive(migrants)
+        solution = population.evolve(generations)
+        if solution is not None:
+            connection.send(("solution", solution, population.evaluations))
+        else:
+            connection.send(("migrants", population.best(migrant_count),
+                             population.best_conflicts(), population.evaluations))
+
+def island_genetic_algorithm(n, islands=4, population_size=200, migration_interval=20, migrants=2,
+                             max_generations=1000, tournament_size=8, crossover_rate=0.9, mutation_rate=0.8,
+                             elite=2, seed=None):
+    """
+    Solve the N-Queens problem with one population per process and ring migration.
+
+    Args:
+        - n: size of the board (N x N)
+        - islands: number of populations, each in its own process
+        - population_size: number of boards per island
+        - migration_interval: generations between migrations
+        - migrants: number of best boards each island sends to the next one
+        - max_generations: maximum number of generations per island
+        - tournament_size, crossover_rate, mutation_rate, elite: see Population
+        - seed: seed from which every island's generator is derived
+
+    Returns:
+        - tuple (solution, stats): solution is the board if found, else None;
+          stats holds generations (per island), migrations, evaluations (all
+          islands), evaluations_per_second, best_conflicts and elapsed seconds
+    """
+    if np is None:
+        raise ImportError("island_genetic_algorithm needs NumPy for its population matrices")
+    settings = {"size": population_size, "tournament_size": tournament_size, "crossover_rate": crossover_rate,
+                "mutation_rate": mutation_rate, "elite": elite}
+    seeds = np.random.SeedSequence(seed).spawn(islands)
+    connections = []
+    processes = []
+    began = time.perf_counter()
+    for island in range(islands):
+        parent_end, child_end = multiprocessing.Pipe()
+        process = multiprocessing.Process(target=island_worker, args=(child_end, n, settings, seeds[island], migrants),
+                                          daemon=True)
+        process.start()
+        connections.append(parent_end)
+        processes.append(process)
+
+    solution = None
+    generations = migrations = 0
+    incoming = [None] * islands
+    evaluations = [0] * islands
+    best_conflicts = None
+    try:
+        while solution is None and generations < max_generations:
+            segment = min(migration_interval, max_generations - generations)
+            for connection, migrants in zip(connections, incoming):
+                connection.send(("run", segment, migrants))
+            outgoing = []
+            for island, connection in enumerate(connections):
+                reply = connection.recv()
+                evaluations[island] = reply[-1]
+                if reply[0] == "solution":
+                    solution = solution or reply[1]
+                else:
+                    outgoing.append(reply[1])
+                    best_conflicts = reply[2] if best_conflicts is None else min(best_conflicts, reply[2])
+            generations += segment
+            if solution is not None:
+                break
+            # Ring migration: island i receives the best boards of island i - 1
+            incoming = outgoing[-1:] + outgoing[:-1]
+            migrations += 1
+    finally:
+        for connection in connections:
+            connection.send(("stop",))
+        for process in processes:
+            process.join()
+
+    elapsed = time.perf_counter() - began
+    stats = {"generations": generations, "migrations": migrations, "evaluations": sum(evaluations),
+             "evaluations_per_second": sum(evaluations) / elapsed if elapsed else None,
+             "best_conflicts": 0 if solution is not None else best_conflicts, "elapsed": elapsed}
+    return solution, stats
+
+if __name__ == "__main__":
+    # Example usage
+    solution, stats = genetic_algorithm(8, seed=1)
+    if solution:
+        print("Solution found:", solution, "conflicts:", calculate_conflicts(solution))
+    else:
+        print("No solution found.")
+    print(f"n=8: {stats['generations']} generations, {stats['evaluations_per_second']:.0f} evaluations/s")
+
+    for n in (64, 128):
+        solution, stats = island_genetic_algorithm(n, islands=4, seed=1)
+        print(f"n={n} islands: {'solved' if solution else 'not solved'} in {stats['generations']} generations, "
+              f"{stats['evaluations_per_second']:.0f} evaluations/s")
\ No newline at end of file
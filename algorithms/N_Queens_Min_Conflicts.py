@@ -0,0 +1,181 @@
+import random
+import time
+
+from N_Queens_Conflicts import ConflictCounter, np, random_board
+
+def greedy_initial_board(n, max_tries=100):
+    """
+    Build a low-conflict starting board row by row.
+
+    The board starts as a random permutation, so no two queens share a column.
+    For each row, a few random queens from the rows not yet placed are tried
+    and the first one that sits on no occupied diagonal is swapped in.
+
+    Args:
+        - n: size of the board (N x N)
+        - max_tries: random candidates tried per row before accepting a conflict
+
+    Returns:
+        - array('i') where index is row, value is column of the queen
+    """
+    board = random_board(n)
+    diagonals = [False] * (2 * n - 1)
+    anti_diagonals = [False] * (2 * n - 1)
+    for row in range(n):
+        for _ in range(max_tries):
+            swap = random.randrange(row, n)
+            col = board[swap]
+            if not diagonals[row + col] and not anti_diagonals[row - col + n - 1]:
+                board[row], board[swap] = col, board[row]
+                break
+        col = board[row]
+        diagonals[row + col] = True
+        anti_diagonals[row - col + n - 1] = True
+    return board
+
+def conflicted_rows(counter):
+    """Rows whose queen is attacked by at least one other queen."""
+    if np is None:
+        return [row for row in range(counter.n) if counter.queen_conflicts(row) > 0]
+    n = counter.n
+    board = np.asarray(counter.board, dtype=np.int64)
+    rows = np.arange(n)
+    columns, diagonals, anti_diagonals = (np.asarray(counts) for counts in
+                                          (counter.columns, counter.diagonals, counter.anti_diagonals))
+    attacks = columns[board] + diagonals[rows + board] + anti_diagonals[rows - board + n - 1] - 3
+    return np.flatnonzero(attacks > 0).tolist()
+
+def swap_deltas(counter, columns_of, row):
+    """
+    Conflict change of swapping the queen in row's column with every other queen's.
+
+    A swap leaves every column count unchanged, so only the two diagonal
+    families move: the pair leaves diagonals p1, p2 and joins q1, q2. With k the
+    current counts, each family changes by k[q1] + k[q2] - k[p1] - k[p2] + 2,
+    plus 1 if the queens shared a diagonal before (p1 == p2) and 1 if they share
+    one after (q1 == q2); for queens in different columns no other indices
+    coincide.
+
+    Args:
+        - counter: ConflictCounter of the current board
+        - columns_of: NumPy copy of the board (the board list itself without NumPy)
+        - row: row of the queen to move
+
+    Returns:
+        - deltas indexed by partner row; rows whose queen shares row's column
+          (row itself included) hold 3 * n, larger than any real delta
+    """
+    n = counter.n
+    col = counter.board[row]
+    p1, a1 = row + col, row - col + n - 1
+    if np is None:
+        diagonals, anti_diagonals = counter.diagonals, counter.anti_diagonals
+        deltas = []
+        for other, other_col in enumerate(columns_of):
+            p2, q1, q2 = other + other_col, row + other_col, other + col
+            a2, b1, b2 = other - other_col + n - 1, row - other_col + n - 1, other - col + n - 1
+            if other_col == col:
+                deltas.append(3 * n)
+                continue
+            deltas.append(diagonals[q1] + diagonals[q2] - diagonals[p1] - diagonals[p2] + 2
+                          + (p1 == p2) + (q1 == q2)
+                          + anti_diagonals[b1] + anti_diagonals[b2] - anti_diagonals[a1] - anti_diagonals[a2] + 2
+                          + (a1 == a2) + (b1 == b2))
+    else:
+        _, diagonals, anti_diagonals = counter.numpy_counters()
+        others = np.arange(n)
+        p2, q1, q2 = others + columns_of, row + columns_of, others + col
+        a2, b1, b2 = others - columns_of + n - 1, row - columns_of + n - 1, others - col + n - 1
+        deltas = (diagonals[q1] + diagonals[q2] - diagonals[p1] - diagonals[p2] + 2
+                  + (p2 == p1) + (q1 == q2)
+                  + anti_diagonals[b1] + anti_diagonals[b2] - anti_diagonals[a1] - anti_diagonals[a2] + 2
+                  + (a2 == a1) + (b1 == b2))
+        deltas[columns_of == col] = 3 * n
+    return deltas
+
+def min_conflicts_repair(board, max_steps=100000, noise=0.2):
+    """
+    Repair a board with the min-conflicts heuristic.
+
+    A random queen is taken from the set of conflicted rows and moved to the
+    column that leaves the fewest conflicts; the queen holding that column
+    takes the freed one, so column counts never change and a permutation stays
+    a permutation. Ties are broken at random and the best move is made even
+    when it does not help; when no move improves, a random swap is made with
+    probability noise so the search cannot cycle on a plateau. Rows that stop
+    being conflicted are dropped lazily; the set is rebuilt with one O(n) scan
+    whenever it runs dry while conflicts remain.
+
+    Args:
+        - board: starting board, modified in place
+        - max_steps: maximum number of moves
+        - noise: probability of a random swap when no move reduces conflicts
+
+    Returns:
+        - tuple (board or None, number of moves made)
+    """
+    counter = ConflictCounter(board)
+    columns_of = board if np is None else np.array(board, dtype=np.int64)
+    candidates = conflicted_rows(counter)
+    step = 0
+    while counter.conflicts > 0 and step < max_steps:
+        if not candidates:
+            candidates = conflicted_rows(counter)
+        # Pop a random candidate in O(1) by swapping it to the end
+        index = random.randrange(len(candidates))
+        candidates[index], candidates[-1] = candidates[-1], candidates[index]
+        row = candidates.pop()
+        if counter.queen_conflicts(row) == 0:
+            continue
+        step += 1
+        deltas = swap_deltas(counter, columns_of, row)
+        best_delta = min(deltas) if np is None else int(deltas.min())
+        if best_delta >= 0 and random.random() < noise:
+            # Plateau or local minimum: sometimes swap with a random queen instead
+            other = random.randrange(counter.n)
+            if board[other] == board[row]:
+                continue
+        elif np is None:
+            other = random.choice([other for other, delta in enumerate(deltas) if delta == best_delta])
+        else:
+            other = random.choice(np.flatnonzero(deltas == best_delta).tolist())
+        col, other_col = board[row], board[other]
+        counter.apply(row, other_col)
+        counter.apply(other, col)
+        if np is not None:
+            columns_of[row], columns_of[other] = other_col, col
+        for moved in (row, other):
+            if counter.queen_conflicts(moved) > 0:
+                candidates.append(moved)
+    return (board if counter.conflicts == 0 else None), step
+
+def min_conflicts(n, max_steps=100000):
+    """
+    Solve the N-Queens problem with greedy placement followed by min-conflicts repair.
+
+    Args:
+        - n: size of the board (N x N)
+        - max_steps: maximum number of repair moves
+
+    Returns:
+        - list representing the board if solution found, else None
+    """
+    board, _ = min_conflicts_repair(greedy_initial_board(n), max_steps)
+    return None if board is None else board.tolist()
+
+if __name__ == "__main__":
+    # Example usage with phase timings
+    for n in (8, 1000000):
+        began = time.perf_counter()
+        board = greedy_initial_board(n)
+        placed = time.perf_counter()
+        counter = ConflictCounter(board)
+        solution, steps = min_conflicts_repair(board)
+        finished = time.perf_counter()
+        print(f"n={n}: initial conflicts {counter.conflicts}, placement {placed - began:.2f}s, "
+              f"repair {finished - placed:.2f}s ({steps} moves), total {finished - began:.2f}s, "
+              f"board and counters {counter.memory_bytes() / 1e6:.1f} MB")
+        if solution:
+            print("Solution found:", solution.tolist() if n <= 8 else f"{solution[:8].tolist()}...")
+        else:
+            print("No solution found.")
\ No newline at end of file
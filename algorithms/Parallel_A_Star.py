@@ -0,0 +1,212 @@
+# Hash-Distributed A* (HDA*): one grid query split across worker processes
+#
+# Every cell is owned by exactly one worker (chosen by hashing its position).
+# Each worker keeps its own open/closed lists and only expands cells it owns;
+# generated cells owned by another worker are batched and sent to the owner's
+# inbox. Termination uses repeated probe waves: the search is over once two
+# consecutive waves find every worker passive (no open node with f below the
+# best solution cost) with identical, balanced sent/received batch counts.
+
+import multiprocessing
+import queue as queue_module
+import time
+
+from A_Star import is_valid, manhattan_distance, maze, start, goal
+from Indexed_Priority_Queue import IndexedPriorityQueue
+
+def owner_of(position, workers):
+    """Hash a (row, col) position to the index of the worker that owns it."""
+    row, col = position
+    return ((row * 73856093) ^ (col * 19349663)) % workers
+
+def hda_worker(wid, workers, grid, goal, inboxes, results, expand_batch, send_batch):
+    """
+    Worker loop: expand owned nodes, route generated nodes to their owners and
+    answer probe, incumbent, trace and stop messages.
+    """
+    inbox = inboxes[wid]
+    open_list = IndexedPriorityQueue()
+    g_scores = {}
+    came_from = {}
+    outgoing = [[] for _ in range(workers)]
+    incumbent = float('inf')
+    sent = received = 0
+    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Up, down, left, right
+
+    def relax(position, g_score, parent):
+        if g_score < g_scores.get(position, float('inf')):
+            g_scores[position] = g_score
+            came_from[position] = parent
+            # Reopens the node if it was already expanded with a worse cost
+            open_list.push(position, g_score + manhattan_distance(position, goal))
+
+    def flush():
+        nonlocal sent
+        for target, batch in enumerate(outgoing):
+            if batch:
+                inboxes[target].put(("nodes", batch))
+                outgoing[target] = []
+                sent += 1
+
+    def has_work():
+        return bool(open_list) and open_list.peek()[1] < incumbent
+
+    while True:
+        if has_work():
+            try:
+                message = inbox.get_nowait()
+            except queue_module.Empty:
+                message = None
+        else:
+            message = inbox.get()
+
+        if message is not None:
+            kind = message[0]
+            if kind == "nodes":
+                received += 1
+                for position, g_score, parent in message[1]:
+                    relax(position, g_score, parent)
+            elif kind == "incumbent":
+                incumbent = min(incumbent, message[1])
+            elif kind == "probe":
+                results.put(("status", wid, message[1], not has_work(), sent, received))
+            elif kind == "trace":
+                # Follow predecessors while they are owned here, then hand over
+                _, position, sequence = message
+                segment = [position]
+                parent = came_from[position]
+                while parent is not None and owner_of(parent, workers) == wid:
+                    segment.append(parent)
+                    parent = came_from[parent]
+                results.put(("segment", sequence, segment, parent is None))
+                if parent is not None:
+                    inboxes[owner_of(parent, workers)].put(("trace", parent, sequence + 1))
+            elif kind == "stop":
+                return
+            continue
+
+        for _ in range(expand_batch):
+            if not has_work():
+                break
+            current, _ = open_list.pop()
+            g_score = g_scores[current]
+            if current == goal:
+                incumbent = g_score
+                results.put(("solution", g_score))
+                continue
+            row, col = current
+            for dr, dc in directions:
+                nr, nc = row + dr, col + dc
+                if not is_valid(nr, nc, grid):
+                    continue
+                next_pos = (nr, nc)
+                if g_score + 1 + manhattan_distance(next_pos, goal) >= incumbent:
+                    continue
+                target = owner_of(next_pos, workers)
+                if target == wid:
+                    relax(next_pos, g_score + 1, current)
+                else:
+                    outgoing[target].append((next_pos, g_score + 1, current))
+                    if len(outgoing[target]) >= send_batch:
+                        inboxes[target].put(("nodes", outgoing[target]))
+                        outgoing[target] = []
+                        sent += 1
+        flush()
+
+def parallel_a_star_search(start, goal, grid=None, workers=None, expand_batch=64,
+                           send_batch=256, probe_interval=0.002):
+    """
+    Perform Hash-Distributed A* Search with one process per worker.
+
+    Args:
+        - start: tuple (row, col) of start position
+        - goal: tuple (row, col) of goal position
+        - grid: 2D list to search instead of the module-level maze
+        - workers: number of worker processes (default: one per CPU)
+        - expand_batch: nodes a worker expands between inbox checks
+        - send_batch: generated nodes buffered per destination before sending
+        - probe_interval: seconds between termination probe waves
+
+    Returns:
+        - list of positions representing the shortest path if found, else None
+    """
+    if grid is None:
+        grid = maze
+    if start == goal:
+        return [start]
+    workers = workers or multiprocessing.cpu_count()
+
+    inboxes = [multiprocessing.Queue() for _ in range(workers)]
+    results = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=hda_worker,
+                                args=(wid, workers, grid, goal, inboxes, results, expand_batch, send_batch),
+                                daemon=True)
+        for wid in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    inboxes[owner_of(start, workers)].put(("nodes", [(start, 0, None)]))
+    incumbent = float('inf')
+    previous_counts = None
+    wave = 0
+    try:
+        while True:
+            wave += 1
+            for inbox in inboxes:
+                inbox.put(("probe", wave))
+            replies = 0
+            all_passive = True
+            sent, received = 1, 0  # The start node batch counts as sent by the coordinator
+            while replies < workers:
+                message = results.get()
+                if message[0] == "solution":
+                    if message[1] < incumbent:
+                        incumbent = message[1]
+                        for inbox in inboxes:
+                            inbox.put(("incumbent", incumbent))
+                elif message[0] == "status" and message[2] == wave:
+                    replies += 1
+                    all_passive = all_passive and message[3]
+                    sent += message[4]
+                    received += message[5]
+            counts = (sent, received)
+            if all_passive and sent == received:
+                if counts == previous_counts:
+                    break
+                previous_counts = counts
+            else:
+                previous_counts = None
+            time.sleep(probe_interval)
+
+        if incumbent == float('inf'):
+            return None
+
+        # Reassemble the path from per-worker segments, goal first
+        inboxes[owner_of(goal, workers)].put(("trace", goal, 0))
+        segments = {}
+        last_sequence = None
+        while last_sequence is None or len(segments) <= last_sequence:
+            message = results.get()
+            if message[0] == "segment":
+                segments[message[1]] = message[2]
+                if message[3]:
+                    last_sequence = message[1]
+        path = [position for sequence in range(last_sequence + 1) for position in segments[sequence]]
+        path.reverse()
+        return path
+    finally:
+        for inbox in inboxes:
+            inbox.put(("stop",))
+        for process in processes:
+            process.join()
+
+if __name__ == "__main__":
+    # Example usage
+    result_path = parallel_a_star_search(start, goal, workers=4)
+
+    if result_path:
+        print("Path found:", result_path)
+    else:
+        print("No path found.")
\ No newline at end of file
@@ -0,0 +1,135 @@
+# Parallel random restarts for the N-Queens local searches
+#
+# Independent restarts are farmed out to a fixed set of worker processes,
+# each fed chunks of seeds over its own pipe as soon as it finishes the last
+# one. Restart i reseeds the worker's random module with the i-th value drawn
+# from one master seed, so every restart has its own stream and a seeded run
+# tries the same boards no matter how many workers share the work. When the
+# first zero-conflict board arrives, no more chunks are sent and the workers
+# still inside a restart are terminated, so the call returns at once.
+#
+# Each worker counts the restarts it begins in its own slot of a shared
+# lock-free array. A worker is the only writer of its slot and the parent
+# sums the slots after every worker has been joined, so terminating a worker
+# can never leave a lock held.
+
+import multiprocessing
+import random
+import time
+from multiprocessing.connection import wait
+
+from Hill_Climbing import hill_climbing
+from Hill_Climbing_with_Random_Walk_and_Restart import hill_climbing_with_random_walk
+
+def restart_worker(connection, attempt, args, started, slot):
+    """
+    Worker loop: run one attempt per seed of every chunk received.
+
+    Messages:
+        - list of seeds -> the first board solved in the chunk, or None
+        - None ends the worker
+    """
+    while True:
+        seeds = connection.recv()
+        if seeds is None:
+            return
+        solution = None
+        for seed in seeds:
+            random.seed(seed)
+            started[slot] += 1
+            solution = attempt(*args)
+            if solution:
+                break
+        connection.send(solution or None)
+
+def parallel_restarts(attempt, args=(), max_restarts=100, workers=None, seed=None, chunk_size=1):
+    """
+    Run random restarts of a local search on worker processes until one solves the board.
+
+    Args:
+        - attempt: module-level function running one restart, returning a board or None
+        - args: arguments passed to attempt
+        - max_restarts: maximum number of restarts over all workers
+        - workers: number of worker processes (default: one per CPU)
+        - seed: master seed for the per-restart seeds (None for a fresh run)
+        - chunk_size: restarts sent to a worker at a time
+
+    Returns:
+        - tuple (solution, stats): solution is the first board found, else None;
+          stats holds time_to_solution (seconds, None if unsolved), restarts
+          (restarts begun, including any cut short by the solution), elapsed
+          (including process start and shutdown) and workers
+    """
+    workers = workers or multiprocessing.cpu_count()
+    master = random.Random(seed)
+    seeds = [master.getrandbits(64) for _ in range(max_restarts)]
+    chunks = iter([seeds[i:i + chunk_size] for i in range(0, max_restarts, chunk_size)])
+    context = multiprocessing.get_context("spawn")
+    started = context.RawArray('q', workers)  # restarts begun, one slot per worker
+
+    began = time.perf_counter()
+    solution = None
+    time_to_solution = None
+    connections = []
+    processes = []
+    drained = False  # every chunk was run and every worker told to stop
+    try:
+        for slot in range(workers):
+            parent_end, child_end = context.Pipe()
+            process = context.Process(target=restart_worker, args=(child_end, attempt, args, started, slot),
+                                      daemon=True)
+            process.start()
+            connections.append(parent_end)
+            processes.append(process)
+
+        # Keep every worker busy with one chunk; a worker with no chunk left is told to stop
+        busy = []
+        for connection in connections:
+            chunk = next(chunks, None)
+            connection.send(chunk)
+            if chunk is not None:
+                busy.append(connection)
+        while busy and solution is None:
+            for connection in wait(busy):
+                found = connection.recv()
+                if found:
+                    solution = found
+                    time_to_solution = time.perf_counter() - began
+                    break
+                chunk = next(chunks, None)
+                connection.send(chunk)
+                if chunk is None:
+                    busy.remove(connection)
+        drained = solution is None
+    finally:
+        if not drained:
+            # Restarts still running would only be discarded; do not wait for them
+            for process in processes:
+                process.terminate()
+        for process in processes:
+            process.join()
+    stats = {"time_to_solution": time_to_solution, "restarts": sum(started),
+             "elapsed": time.perf_counter() - began, "workers": workers}
+    return solution, stats
+
+def parallel_hill_climbing_with_restarts(n, max_restarts=100, workers=None, seed=None):
+    """Parallel version of hill_climbing_with_restarts; returns (solution, stats)."""
+    return parallel_restarts(hill_climbing, (n,), max_restarts, workers, seed)
+
+def parallel_hill_climbing_with_random_walk_and_restart(n, random_walk_prob=0.1, max_restarts=100,
+                                                        max_steps=1000, workers=None, seed=None):
+    """Parallel version of hill_climbing_with_random_walk_and_restart; returns (solution, stats)."""
+    return parallel_restarts(hill_climbing_with_random_walk, (n, random_walk_prob, max_steps),
+                             max_restarts, workers, seed)
+
+if __name__ == "__main__":
+    # Example usage
+    n = 8  # For 8-Queens
+    for name, solve in (("Hill Climbing", parallel_hill_climbing_with_restarts),
+                        ("Random Walk", parallel_hill_climbing_with_random_walk_and_restart)):
+        solution, stats = solve(n, workers=4, seed=1)
+        if solution:
+            print(f"{name} solution found:", solution)
+        else:
+            print(f"{name}: no solution found after restarts.")
+        print("Stats:", stats)
\ No newline at end of file
@@ -0,0 +1,172 @@
+# Parallel tempering (replica exchange) for the N-Queens problem
+#
+# K annealing chains run at fixed temperatures on a geometric ladder, spread
+# over worker processes. After every segment of Metropolis steps the workers
+# report each chain's conflict count and the coordinator tries to exchange
+# neighbouring temperatures, alternating even and odd pairs. An exchange
+# between chains at temperatures Ti and Tj with conflicts Ei and Ej is
+# accepted with probability min(1, exp((1/Ti - 1/Tj) * (Ei - Ej))). Only the
+# temperatures move; the boards stay in their workers, so an exchange costs
+# no board transfer. Hot chains keep exploring while cold chains polish the
+# boards that are handed down to them.
+
+import math
+import multiprocessing
+import random
+import time
+
+from N_Queens_Conflicts import ConflictCounter, random_board
+
+def metropolis_steps(counter, rng, temperature, steps):
+    """
+    Run Metropolis moves at a fixed temperature, scoring each move in O(1).
+
+    Args:
+        - counter: ConflictCounter of the chain's board, updated in place
+        - rng: the chain's random.Random stream
+        - temperature: chain temperature
+        - steps: number of moves proposed
+
+    Returns:
+        - True if the board reached zero conflicts, else False
+    """
+    n = counter.n
+    board = counter.board
+    for _ in range(steps):
+        row = rng.randrange(n)
+        # Any column but the current one, drawn without building a list
+        new_col = rng.randrange(n - 1)
+        if new_col >= board[row]:
+            new_col += 1
+        delta = counter.delta(row, new_col)
+        if delta <= 0 or rng.random() < math.exp(-delta / temperature):
+            counter.apply(row, new_col)
+            if counter.conflicts == 0:
+                return True
+    return False
+
+def tempering_worker(connection, n, chain_seeds):
+    """
+    Worker loop: hold some chains and run segments at the temperatures sent by the coordinator.
+
+    Messages:
+        - ("run", {chain: temperature}, steps) -> ("energies", {chain: conflicts})
+          or ("solution", chain, board) as soon as any chain is solved
+        - ("stop",) ends the worker
+    """
+    chains = {}
+    for chain, seed in chain_seeds.items():
+        rng = random.Random(seed)
+        chains[chain] = (rng, ConflictCounter(random_board(n, rng)))
+    while True:
+        message = connection.recv()
+        if message[0] == "stop":
+            return
+        _, temperatures, steps = message
+        energies = {}
+        for chain, temperature in temperatures.items():
+            rng, counter = chains[chain]
+            if counter.conflicts == 0 or metropolis_steps(counter, rng, temperature, steps):
+                connection.send(("solution", chain, counter.board))
+                break
+            energies[chain] = counter.conflicts
+        else:
+            connection.send(("energies", energies))
+
+def parallel_tempering(n, replicas=8, min_temp=0.05, max_temp=0.6, steps_per_exchange=None,
+                       max_exchanges=10000, workers=None, seed=None):
+    """
+    Solve the N-Queens problem with replica-exchange simulated annealing.
+
+    Args:
+        - n: size of the board (N x N)
+        - replicas: number of chains (K)
+        - min_temp: temperature of the coldest chain
+        - max_temp: temperature of the hottest chain
+        - steps_per_exchange: Metropolis moves per chain between exchanges (default: n)
+        - max_exchanges: maximum number of exchange rounds
+        - workers: number of worker processes (default: one per CPU, at most replicas)
+        - seed: seed for the chain streams and exchange decisions (None for a fresh run)
+
+    Returns:
+        - tuple (solution, stats): solution is the board if found, else None;
+          stats holds time_to_solution (seconds, None if unsolved), exchanges
+          (rounds run), steps_per_chain, temperatures (the ladder) and
+          swap_acceptance (accepted / attempted exchanges per neighbouring
+          temperature pair, coldest pair first)
+    """
+    steps_per_exchange = steps_per_exchange or n
+    workers = min(workers or multiprocessing.cpu_count(), replicas)
+    rng = random.Random(seed)
+    ratio = (max_temp / min_temp) ** (1 / (replicas - 1)) if replicas > 1 else 1
+    ladder = [min_temp * ratio ** i for i in range(replicas)]
+    chain_at = list(range(replicas))  # chain_at[i] is the chain running at ladder[i]
+    owner = [chain % workers for chain in range(replicas)]
+    attempted = [0] * (replicas - 1)
+    accepted = [0] * (replicas - 1)
+
+    connections = []
+    processes = []
+    for wid in range(workers):
+        parent_end, child_end = multiprocessing.Pipe()
+        chain_seeds = {chain: rng.getrandbits(64) for chain in range(replicas) if owner[chain] == wid}
+        process = multiprocessing.Process(target=tempering_worker, args=(child_end, n, chain_seeds), daemon=True)
+        process.start()
+        connections.append(parent_end)
+        processes.append(process)
+
+    began = time.perf_counter()
+    solution = None
+    exchanges = 0
+    try:
+        while solution is None and exchanges < max_exchanges:
+            temperatures = [{} for _ in range(workers)]
+            for level, chain in enumerate(chain_at):
+                temperatures[owner[chain]][chain] = ladder[level]
+            for connection, assigned in zip(connections, temperatures):
+                connection.send(("run", assigned, steps_per_exchange))
+            energies = {}
+            for connection in connections:
+                reply = connection.recv()
+                if reply[0] == "solution":
+                    solution = solution or reply[2]
+                else:
+                    energies.update(reply[1])
+            exchanges += 1
+            if solution is not None:
+                break
+
+            # Metropolis exchange of neighbouring temperatures, even and odd pairs in turn
+            for level in range(exchanges % 2, replicas - 1, 2):
+                cold, hot = chain_at[level], chain_at[level + 1]
+                attempted[level] += 1
+                exponent = (1 / ladder[level] - 1 / ladder[level + 1]) * (energies[cold] - energies[hot])
+                if exponent >= 0 or rng.random() < math.exp(exponent):
+                    accepted[level] += 1
+                    chain_at[level], chain_at[level + 1] = hot, cold
+        time_to_solution = time.perf_counter() - began if solution is not None else None
+    finally:
+        for connection in connections:
+            connection.send(("stop",))
+        for process in processes:
+            process.join()
+
+    stats = {
+        "time_to_solution": time_to_solution,
+        "exchanges": exchanges,
+        "steps_per_chain": exchanges * steps_per_exchange,
+        "temperatures": ladder,
+        "swap_acceptance": [accepted[i] / attempted[i] if attempted[i] else None for i in range(replicas - 1)],
+    }
+    return (None if solution is None else solution.tolist()), stats
+
+if __name__ == "__main__":
+    # Example usage
+    for n in (8, 100):
+        solution, stats = parallel_tempering(n, workers=4, seed=1)
+        if solution:
+            print("Solution found:", solution if n <= 8 else f"{solution[:8]}...")
+        else:
+            print("No solution found.")
+        print(f"n={n}: time to solution {stats['time_to_solution']}, exchanges {stats['exchanges']}")
+        print("Swap acceptance:", [round(rate, 2) for rate in stats["swap_acceptance"] if rate is not None])
\ No newline at end of file
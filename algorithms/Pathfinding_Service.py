@@ -0,0 +1,186 @@
+# asyncio pathfinding service: A* queries over a local socket, run on a process pool
+#
+# Protocol: one JSON object per line.
+#   {"maze": [[0, 1, ...], ...], "start": [row, col], "goal": [row, col]}
+#       -> {"path": [[row, col], ...]}  (or {"path": null} if unreachable)
+#   {"stats": true}
+#       -> {"queue_depth": ..., "latency_ms": {"p50": ..., "p90": ..., "p99": ...}, ...}
+# Overloaded requests get {"error": "busy"}; malformed requests and searches
+# that fail get {"error": "..."} as well, and the connection stays open.
+
+STREAM_LIMIT = 64 * 1024 * 1024  # longest accepted request line (mazes are sent inline)
+
+import asyncio
+import json
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from A_Star import a_star_search
+from Search_Stats import percentile
+
+class ServiceBusy(Exception):
+    """Raised when too many distinct queries are already in flight."""
+
+def solve_query(maze, start, goal):
+    """Worker entry point: run A* on the maze shipped with the query."""
+    return a_star_search(start, goal, grid=maze)
+
+class PathfindingService:
+    """
+    Coalesces identical in-flight (maze, start, goal) queries and runs the
+    distinct ones on a process pool.
+
+    Args:
+        - max_workers: number of worker processes (default: one per CPU)
+        - max_pending: maximum number of distinct queries in flight before
+          new ones are rejected with ServiceBusy
+        - latency_window: number of recent request latencies kept for percentiles
+    """
+
+    def __init__(self, max_workers=None, max_pending=64, latency_window=1000):
+        # Spawned workers do not inherit the service's open client sockets
+        self.executor = ProcessPoolExecutor(max_workers, mp_context=multiprocessing.get_context("spawn"))
+        self.max_pending = max_pending
+        self.in_flight = {}  # (maze, start, goal) -> future of the running search
+        self.latencies = deque(maxlen=latency_window)
+        self.served = 0
+        self.coalesced = 0
+        self.rejected = 0
+        self.server = None
+        self.connections = set()  # handler tasks of open client connections
+
+    @property
+    def queue_depth(self):
+        """Number of distinct searches submitted to the pool and not yet finished."""
+        return len(self.in_flight)
+
+    async def find_path(self, maze, start, goal):
+        """
+        Find a path, sharing the result with any identical query already running.
+
+        Returns:
+            - list of (row, col) positions if found, else None
+        """
+        began = time.perf_counter()
+        key = (tuple(map(tuple, maze)), tuple(start), tuple(goal))
+        future = self.in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            if len(self.in_flight) >= self.max_pending:
+                self.rejected += 1
+                raise ServiceBusy()
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self.executor, solve_query, *key)
+            self.in_flight[key] = future
+            future.add_done_callback(lambda _: self.in_flight.pop(key, None))
+        # Shield so one cancelled caller does not cancel the search for the others
+        path = await asyncio.shield(future)
+        self.latencies.append(time.perf_counter() - began)
+        self.served += 1
+        return path
+
+    def stats(self):
+        """Queue depth, request counters and latency percentiles in milliseconds."""
+        ordered = sorted(self.latencies)
+        return {
+            "queue_depth": self.queue_depth,
+            "served": self.served,
+            "coalesced": self.coalesced,
+            "rejected": self.rejected,
+            "latency_ms": {
+                name: None if value is None else value * 1000
+                for name, value in (("p50", percentile(ordered, 0.50)),
+                                    ("p90", percentile(ordered, 0.90)),
+                                    ("p99", percentile(ordered, 0.99)))
+            },
+        }
+
+    async def handle_client(self, reader, writer):
+        """Serve newline-delimited JSON requests on one connection."""
+        task = asyncio.current_task()
+        self.connections.add(task)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise TypeError("expected a JSON object")
+                    if request.get("stats"):
+                        response = self.stats()
+                    else:
+                        path = await self.find_path(request["maze"], request["start"], request["goal"])
+                        response = {"path": path}
+                except ServiceBusy:
+                    response = {"error": "busy"}
+                except (ValueError, KeyError, TypeError) as error:
+                    response = {"error": f"bad request: {error}"}
+                except Exception as error:  # Any other failure of the search itself
+                    response = {"error": f"search failed: {type(error).__name__}: {error}"}
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        finally:
+            self.connections.discard(task)
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=0):
+        """
+        Start listening on a local socket (port 0 picks a free port).
+
+        Returns:
+            - tuple (host, port) the service is bound to
+        """
+        self.server = await asyncio.start_server(self.handle_client, host, port, limit=STREAM_LIMIT)
+        return self.server.sockets[0].getsockname()[:2]
+
+    async def stop(self, grace=1.0):
+        """Stop accepting connections, let open ones finish, and shut the pool down."""
+        self.server.close()
+        await self.server.wait_closed()
+        if self.connections:
+            _, lingering = await asyncio.wait(self.connections, timeout=grace)
+            for task in lingering:
+                task.cancel()
+        # Shutting the pool down waits for running searches; do that off the event loop
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, partial(self.executor.shutdown, cancel_futures=True))
+
+async def query(host, port, message):
+    """Send one request to a running service and return the decoded response."""
+    reader, writer = await asyncio.open_connection(host, port, limit=STREAM_LIMIT)
+    writer.write(json.dumps(message).encode() + b"\n")
+    await writer.drain()
+    response = json.loads(await reader.readline())
+    writer.close()
+    await writer.wait_closed()
+    return response
+
+async def main():
+    maze = [
+        [0, 1, 0, 0, 0],
+        [0, 1, 0, 1, 0],
+        [0, 0, 0, 1, 0],
+        [1, 1, 0, 1, 0],
+        [0, 0, 0, 0, 0]
+    ]
+    service = PathfindingService(max_workers=2)
+    host, port = await service.start()
+
+    # Five identical queries are coalesced into one search; the sixth runs separately
+    requests = [{"maze": maze, "start": [0, 0], "goal": [4, 4]}] * 5
+    requests.append({"maze": maze, "start": [0, 0], "goal": [0, 4]})
+    responses = await asyncio.gather(*(query(host, port, request) for request in requests))
+    for request, response in zip(requests, responses):
+        print(f"{request['start']} -> {request['goal']}:", response["path"])
+    print("Stats:", await query(host, port, {"stats": True}))
+
+    await service.stop()
+
+if __name__ == "__main__":
+    asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,187 @@
+# Rectangular Symmetry Reduction (RSR) for 4-connected grid maps
+#
+# The free cells of the maze are split into obstacle-free rectangles. Only the
+# perimeter cells of each rectangle are kept as graph nodes; they are linked to
+# their neighbouring perimeter cells (cost 1) and by macro edges straight across
+# the rectangle (cost = rectangle height or width). Every optimal path through
+# an empty rectangle has an equal-cost counterpart that runs along perimeter
+# cells and macro edges, so searching the reduced graph stays optimal while the
+# many symmetric routes through open areas are never generated.
+
+from A_Star import maze, start, goal, manhattan_distance
+from Indexed_Priority_Queue import IndexedPriorityQueue
+
+class RectangularSymmetryReduction:
+    """
+    Preprocessed maze that answers shortest-path queries on the reduced graph.
+
+    Args:
+        - grid: 2D list where 0 is open and 1 is a wall
+
+    Attributes:
+        - rectangles: list of (top, left, bottom, right) obstacle-free rectangles
+        - rect_of: 2D list mapping each cell to its rectangle index (-1 for walls)
+        - edges: dict of perimeter cell -> list of (neighbour, cost)
+    """
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.rows = len(grid)
+        self.cols = len(grid[0])
+        self.rectangles = []
+        self.rect_of = [[-1] * self.cols for _ in range(self.rows)]
+        self.decompose()
+        self.edges = {}
+        self.build_graph()
+
+    def is_open(self, row, col):
+        return 0 <= row < self.rows and 0 <= col < self.cols and self.grid[row][col] == 0
+
+    def decompose(self):
+        """From each unassigned open cell, claim the largest-area rectangle it can anchor."""
+        rect_of = self.rect_of
+        for row in range(self.rows):
+            for col in range(self.cols):
+                if self.grid[row][col] != 0 or rect_of[row][col] != -1:
+                    continue
+                # Scan downwards, narrowing the width to the shortest free run so far
+                width = self.cols - col
+                best_area, bottom, right = 0, row, col
+                r = row
+                while r < self.rows and width > 0:
+                    run = 0
+                    while run < width and self.grid[r][col + run] == 0 and rect_of[r][col + run] == -1:
+                        run += 1
+                    width = run
+                    if width * (r - row + 1) > best_area:
+                        best_area, bottom, right = width * (r - row + 1), r, col + width - 1
+                    r += 1
+                index = len(self.rectangles)
+                self.rectangles.append((row, col, bottom, right))
+                for r in range(row, bottom + 1):
+                    for c in range(col, right + 1):
+                        rect_of[r][c] = index
+
+    def on_perimeter(self, row, col):
+        top, left, bottom, right = self.rectangles[self.rect_of[row][col]]
+        return row in (top, bottom) or col in (left, right)
+
+    def build_graph(self):
+        """Link perimeter cells to their perimeter neighbours and across their rectangle."""
+        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Up, down, left, right
+        for index, (top, left, bottom, right) in enumerate(self.rectangles):
+            perimeter = {(r, c) for r in (top, bottom) for c in range(left, right + 1)}
+            perimeter |= {(r, c) for r in range(top, bottom + 1) for c in (left, right)}
+            for row, col in perimeter:
+                edges = self.edges.setdefault((row, col), [])
+                for dr, dc in directions:
+                    nr, nc = row + dr, col + dc
+                    # Cells outside this rectangle always lie on their own rectangle's perimeter
+                    if self.is_open(nr, nc) and (self.rect_of[nr][nc] != index or (nr, nc) in perimeter):
+                        edges.append(((nr, nc), 1))
+                # Macro edges straight through the interior to the opposite side
+                if left < col < right:
+                    if row == top and bottom > top + 1:
+                        edges.append(((bottom, col), bottom - top))
+                    elif row == bottom and bottom > top + 1:
+                        edges.append(((top, col), bottom - top))
+                if top < row < bottom:
+                    if col == left and right > left + 1:
+                        edges.append(((row, right), right - left))
+                    elif col == right and right > left + 1:
+                        edges.append(((row, left), right - left))
+
+    def insertion_edges(self, cell):
+        """Straight edges from an interior cell to the perimeter in each direction."""
+        row, col = cell
+        top, left, bottom, right = self.rectangles[self.rect_of[row][col]]
+        return [((top, col), row - top), ((bottom, col), bottom - row),
+                ((row, left), col - left), ((row, right), right - col)]
+
+    def search(self, start, goal, use_heuristic=True):
+        """
+        Find a shortest cell path on the reduced graph.
+
+        Args:
+            - start: tuple (row, col) of start position
+            - goal: tuple (row, col) of goal position
+            - use_heuristic: True for A* (Manhattan), False for uniform cost search
+
+        Returns:
+            - list of positions representing the shortest path if found, else None
+        """
+        if not self.is_open(*start) or not self.is_open(*goal):
+            return None
+        if self.rect_of[start[0]][start[1]] == self.rect_of[goal[0]][goal[1]]:
+            # Inside one empty rectangle any monotone path is optimal
+            return self.expand([start, (start[0], goal[1]), goal])
+
+        # Temporarily connect interior start/goal cells to their rectangle's perimeter
+        extra = {}
+        if not self.on_perimeter(*start):
+            extra[start] = self.insertion_edges(start)
+        if not self.on_perimeter(*goal):
+            for cell, cost in self.insertion_edges(goal):
+                extra.setdefault(cell, []).append((goal, cost))
+
+        def heuristic(cell):
+            return manhattan_distance(cell, goal) if use_heuristic else 0
+
+        queue = IndexedPriorityQueue()
+        queue.push(start, heuristic(start))
+        g_scores = {start: 0}
+        came_from = {}
+        visited = set()
+
+        while queue:
+            current, _ = queue.pop()
+            if current == goal:
+                nodes = [current]
+                while current in came_from:
+                    current = came_from[current]
+                    nodes.append(current)
+                nodes.reverse()
+                return self.expand(nodes)
+            visited.add(current)
+            for next_cell, cost in self.edges.get(current, []) + extra.get(current, []):
+                if next_cell in visited:
+                    continue
+                new_g_score = g_scores[current] + cost
+                if next_cell not in g_scores or new_g_score < g_scores[next_cell]:
+                    g_scores[next_cell] = new_g_score
+                    came_from[next_cell] = current
+                    queue.push(next_cell, new_g_score + heuristic(next_cell))
+        return None
+
+    def a_star_search(self, start, goal):
+        return self.search(start, goal, use_heuristic=True)
+
+    def uniform_cost_search(self, start, goal):
+        return self.search(start, goal, use_heuristic=False)
+
+    @staticmethod
+    def expand(nodes):
+        """Turn a list of graph nodes joined by straight edges into a cell-by-cell path."""
+        path = [nodes[0]]
+        for row, col in nodes[1:]:
+            r, c = path[-1]
+            while (r, c) != (row, col):
+                if r != row:
+                    r += 1 if row > r else -1
+                else:
+                    c += 1 if col > c else -1
+                path.append((r, c))
+        return path
+
+if __name__ == "__main__":
+    # Example usage
+    reduction = RectangularSymmetryReduction(maze)
+    open_cells = sum(row.count(0) for row in maze)
+    print(f"Reduced graph keeps {len(reduction.edges)} of {open_cells} open cells "
+          f"in {len(reduction.rectangles)} rectangles")
+    result_path = reduction.a_star_search(start, goal)
+
+    if result_path:
+        print("Path found:", result_path)
+    else:
+        print("No path found.")
\ No newline at end of file
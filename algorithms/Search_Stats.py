@@ -0,0 +1,13 @@
+# Summary statistics shared by the search service and the benchmarks
+#
+# Kept free of other imports so that a benchmark can use it without pulling
+# in asyncio, process pools or any of the solvers.
+
+import math
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
\ No newline at end of file
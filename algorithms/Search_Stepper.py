@@ -0,0 +1,70 @@
+# Cooperative stepping helpers for the generator-based grid searches
+#
+# Every *_steps search yields the number of nodes it expanded since the last
+# yield and returns its path (or None) as the generator's completion value.
+# The slice that reaches the goal or empties the frontier is yielded too,
+# before the return, so the yielded counts add up to every expansion.
+# A slice size (nodes_per_step) below 1 is rejected with ValueError when the
+# generator is first advanced.
+
+class SearchStepper:
+    """
+    Wrap a step generator so a frame loop can advance it a slice at a time.
+
+    Attributes:
+        - done: True once the search has finished
+        - result: path returned by the search (None until done, or if no path)
+        - expanded: number of nodes expanded so far
+    """
+
+    def __init__(self, steps):
+        self.steps = steps
+        self.done = False
+        self.result = None
+        self.expanded = 0
+
+    def step(self):
+        """
+        Advance the search by one slice.
+
+        Returns:
+            - int: number of nodes expanded in this slice
+        """
+        if self.done:
+            return 0
+        try:
+            expanded = next(self.steps)
+        except StopIteration as finished:
+            self.done = True
+            self.result = finished.value
+            return 0
+        self.expanded += expanded
+        return expanded
+
+def run_to_completion(steps):
+    """Drive a step generator until it finishes and return its path."""
+    stepper = SearchStepper(steps)
+    while not stepper.done:
+        stepper.step()
+    return stepper.result
+
+def run_frame(steppers, node_budget):
+    """
+    Advance unfinished steppers round-robin until a frame's node budget is spent.
+
+    Args:
+        - steppers: list of SearchStepper objects
+        - node_budget: maximum number of node expansions for this frame
+
+    Returns:
+        - int: number of nodes expanded during the frame
+    """
+    spent = 0
+    active = [stepper for stepper in steppers if not stepper.done]
+    while active and spent < node_budget:
+        for stepper in active:
+            spent += stepper.step()
+            if spent >= node_budget:
+                break
+        active = [stepper for stepper in active if not stepper.done]
+    return spent
\ No newline at end of file
@@ -1,112 +1,307 @@
-import random
+import time
+from array import array
 from collections import deque
 
-def calculate_conflicts(board):
+from N_Queens_Conflicts import ConflictCounter, np, random_board
+from Search_Checkpoint import load_checkpoint, save_checkpoint
+
+class TabuEngine:
     """
-    Calculate the number of conflicts (attacking pairs) in the current board configuration.
+    Tabu search state with O(1) tabu checks and cached best moves per row.
     
-    Args:
-    - board: list where index is row, value is column of the queen
+    Moving a queen away from a column makes returning to that column tabu for
+    tenure iterations; tabu_until[row][col] holds the iteration at which the
+    ban ends (n * n entries). A tabu move is still taken when it would give a
+    new best board (aspiration).
     
-    Returns:
-    - int: number of conflicting pairs
-    """
-    n = len(board)
-    conflicts = 0
-    for i in range(n):
-        for j in range(i + 1, n):
-            # Same column or diagonal
-            if board[i] == board[j] or abs(board[i] - board[j]) == j - i:
-                conflicts += 1
-    return conflicts
-
-def get_neighbors(board):
-    """
-    Generate all possible neighbors by moving one queen to a different column in its row.
+    Only queens under attack are moved. For each such row the engine caches
+    its best allowed move and its best move ignoring tabu. After a move, only
+    rows whose conflict count changed (queens on the six lines the moved
+    queen left or joined) and rows whose ban expired are rescanned; every
+    other row can only have gained the three squares on lines the queen left,
+    which are checked in O(1) per row. Remaining cache errors are optimistic,
+    so the chosen row is rescanned before its move is trusted.
     
-    Args:
-    - board: current board configuration
+    The moves made depend only on the board, the active bans, the iteration
+    and the best conflict count, never on the caches, so an engine rebuilt
+    from a checkpoint of those continues exactly as the saved one would have.
     
-    Returns:
-    - List of (new_board, row, new_col) tuples
+    Args:
+    - board: array or list where index is row, value is column; mutated in place
+    - tenure: number of iterations a move stays tabu
     """
-    n = len(board)
-    neighbors = []
-    for row in range(n):
-        current_col = board[row]
-        for new_col in range(n):
-            if new_col != current_col:
-                new_board = board[:]
-                new_board[row] = new_col
-                neighbors.append((new_board, row, new_col))
-    return neighbors
+    
+    def __init__(self, board, tenure=50):
+        n = len(board)
+        self.counter = ConflictCounter(board)
+        self.board = board
+        self.n = n
+        self.tenure = tenure
+        self.iteration = 0
+        self.expiries = deque()  # (iteration the ban ends, row), in order
+        self.line_rows = ([set() for _ in range(n)], [set() for _ in range(2 * n - 1)],
+                          [set() for _ in range(2 * n - 1)])
+        for row in range(n):
+            for rows, line in zip(self.line_rows, self.lines(row, board[row])):
+                rows[line].add(row)
+        if np is None:
+            self.tabu_until = [[0] * n for _ in range(n)]
+            self.best_allowed = [(3 * n, 0)] * n  # row -> (delta, col) of its best non-tabu move
+            self.best_any = [(3 * n, 0)] * n      # row -> (delta, col) of its best move
+        else:
+            self.tabu_until = np.zeros((n, n), dtype=np.int32)
+            self.allowed_delta = np.full(n, 3 * n, dtype=np.int64)
+            self.allowed_col = np.zeros(n, dtype=np.int64)
+            self.any_delta = np.full(n, 3 * n, dtype=np.int64)
+            self.any_col = np.zeros(n, dtype=np.int64)
+        self.best_board = board[:]
+        self.best_conflicts = self.counter.conflicts
+        self.checkpoints = 0
+        self.checkpoint_seconds = 0.0
+        for row in range(n):
+            self.refresh(row)
+    
+    def lines(self, row, col):
+        """Indices of the column, diagonal and anti-diagonal through a square."""
+        return col, row + col, row - col + self.n - 1
+    
+    def refresh(self, row):
+        """Rescan one row and store its best allowed and best overall move."""
+        n = self.n
+        if self.counter.queen_conflicts(row) == 0:
+            allowed = best = (3 * n, 0)
+        else:
+            deltas = self.counter.row_deltas(row)
+            if np is None:
+                best_col = min(range(n), key=deltas.__getitem__)
+                best = (deltas[best_col], best_col)
+                allowed = min(((delta, col) for col, delta in enumerate(deltas)
+                               if self.tabu_until[row][col] <= self.iteration), default=(3 * n, 0))
+            else:
+                best_col = int(deltas.argmin())
+                best = (int(deltas[best_col]), best_col)
+                deltas[self.tabu_until[row] > self.iteration] = 3 * n
+                allowed_col = int(deltas.argmin())
+                allowed = (int(deltas[allowed_col]), allowed_col)
+        if np is None:
+            self.best_allowed[row], self.best_any[row] = allowed, best
+        else:
+            self.allowed_delta[row], self.allowed_col[row] = allowed
+            self.any_delta[row], self.any_col[row] = best
+    
+    def cached_move(self, row, allowed):
+        """Cached (delta, col) of a row's best allowed move, or of its best move."""
+        if np is None:
+            return (self.best_allowed if allowed else self.best_any)[row]
+        if allowed:
+            return int(self.allowed_delta[row]), int(self.allowed_col[row])
+        return int(self.any_delta[row]), int(self.any_col[row])
+    
+    def cached_best(self, allowed):
+        """
+        Best move over all rows, rescanning the chosen row until its cache entry is exact.
+        
+        Returns:
+        - tuple (delta, row, new_col), or None if no row has a move
+        """
+        while True:
+            if np is None:
+                cache = self.best_allowed if allowed else self.best_any
+                # Ties go to the lowest row, as with argmin, whatever column the cache holds
+                row = min(range(self.n), key=lambda row: cache[row][0])
+            else:
+                row = int((self.allowed_delta if allowed else self.any_delta).argmin())
+            delta, _ = self.cached_move(row, allowed)
+            if delta >= 3 * self.n:
+                return None
+            self.refresh(row)
+            exact_delta, col = self.cached_move(row, allowed)
+            if exact_delta == delta:
+                return delta, row, col
+    
+    def gain_freed_squares(self, row, old_col):
+        """Lower cached deltas of rows that can now use a square on a line the queen left."""
+        n = self.n
+        counter = self.counter
+        iteration = self.iteration
+        if np is None:
+            for other in range(n):
+                if self.best_any[other][0] >= 3 * n:
+                    continue
+                for col in (old_col, row + old_col - other, other - row + old_col):
+                    if 0 <= col < n and col != self.board[other]:
+                        delta = counter.delta(other, col)
+                        if delta < self.best_any[other][0]:
+                            self.best_any[other] = (delta, col)
+                        if delta < self.best_allowed[other][0] and self.tabu_until[other][col] <= iteration:
+                            self.best_allowed[other] = (delta, col)
+            return
+        columns, diagonals, anti_diagonals = counter.numpy_counters()
+        rows = np.flatnonzero(self.any_delta < 3 * n)
+        if len(rows) == 0:
+            return
+        current = np.array(self.board)[rows] if len(rows) < n else np.array(self.board)
+        own = columns[current] + diagonals[rows + current] + anti_diagonals[rows - current + n - 1] - 3
+        for cols in (np.full(len(rows), old_col), row + old_col - rows, rows - row + old_col):
+            valid = (cols >= 0) & (cols < n) & (cols != current)
+            cols = np.where(valid, cols, 0)
+            deltas = columns[cols] + diagonals[rows + cols] + anti_diagonals[rows - cols + n - 1] - own
+            deltas = np.where(valid, deltas, 3 * n)
+            better = deltas < self.any_delta[rows]
+            self.any_delta[rows[better]] = deltas[better]
+            self.any_col[rows[better]] = cols[better]
+            better = (deltas < self.allowed_delta[rows]) & (self.tabu_until[rows, cols] <= iteration)
+            self.allowed_delta[rows[better]] = deltas[better]
+            self.allowed_col[rows[better]] = cols[better]
+    
+    def step(self):
+        """
+        Make one move: the best move if it gives a new best board (even if tabu),
+        otherwise the best non-tabu move.
+        
+        Returns:
+        - True if a move was made, False if every move is tabu
+        """
+        move = self.cached_best(allowed=False)
+        if move is None or self.counter.conflicts + move[0] >= self.best_conflicts:
+            move = self.cached_best(allowed=True)
+            if move is None:
+                return False
+        _, row, new_col = move
+        old_col = self.board[row]
+        affected = {row}
+        for rows, old_line, new_line in zip(self.line_rows, self.lines(row, old_col), self.lines(row, new_col)):
+            rows[old_line].discard(row)
+            affected |= rows[old_line] | rows[new_line]
+            rows[new_line].add(row)
+        self.counter.apply(row, new_col)
+        self.tabu_until[row][old_col] = self.iteration + self.tenure
+        self.expiries.append((self.iteration + self.tenure, row))
+        for other in affected:
+            self.refresh(other)
+        self.gain_freed_squares(row, old_col)
+        self.iteration += 1
+        # Rows whose ban just ended may have a better allowed move again
+        while self.expiries and self.expiries[0][0] <= self.iteration:
+            self.refresh(self.expiries.popleft()[1])
+        if self.counter.conflicts < self.best_conflicts:
+            self.best_board = self.board[:]
+            self.best_conflicts = self.counter.conflicts
+        return True
+    
+    def save(self, path, end_iteration):
+        """
+        Checkpoint the engine: boards, active bans and counters, but not the caches.
+        
+        Args:
+        - path: checkpoint file, replaced atomically
+        - end_iteration: iteration at which the run stops, kept for resuming
+        """
+        started = time.perf_counter()
+        # Every active ban has an entry in expiries, so only those rows are scanned
+        rows, cols, until = array('i'), array('i'), array('i')
+        for row in sorted({row for _, row in self.expiries}):
+            for col in range(self.n):
+                if self.tabu_until[row][col] > self.iteration:
+                    rows.append(row)
+                    cols.append(col)
+                    until.append(int(self.tabu_until[row][col]))
+        header = {"tenure": self.tenure, "end_iteration": end_iteration, "iteration": self.iteration,
+                  "best_conflicts": self.best_conflicts}
+        save_checkpoint(path, "tabu_search", header, {"board": self.board, "best_board": self.best_board,
+                                                      "tabu_rows": rows, "tabu_cols": cols, "tabu_until": until})
+        self.checkpoints += 1
+        self.checkpoint_seconds += time.perf_counter() - started
+    
+    @classmethod
+    def load(cls, path):
+        """
+        Rebuild an engine from a checkpoint written by save.
+        
+        Returns:
+        - tuple (engine, end_iteration)
+        """
+        header, arrays = load_checkpoint(path, "tabu_search")
+        engine = cls(arrays["board"], tenure=header["tenure"])
+        engine.iteration = header["iteration"]
+        engine.best_board = arrays["best_board"]
+        engine.best_conflicts = header["best_conflicts"]
+        for row, col, until in sorted(zip(arrays["tabu_rows"], arrays["tabu_cols"], arrays["tabu_until"]),
+                                      key=lambda ban: ban[2]):
+            engine.tabu_until[row][col] = until
+            engine.expiries.append((until, row))
+        for row in range(engine.n):
+            engine.refresh(row)
+        return engine, header["end_iteration"]
+    
+    def run(self, max_iterations, checkpoint_path=None, checkpoint_every=60.0):
+        """
+        Step until the board is solved, no move is left or max_iterations moves were made.
+        
+        Args:
+        - max_iterations: maximum number of moves in this call
+        - checkpoint_path: file the engine is saved to periodically and when the call ends (None: never)
+        - checkpoint_every: minimum seconds between checkpoints
+        
+        Returns:
+        - list representing the board if solution found, else None
+        """
+        end_iteration = self.iteration + max_iterations
+        last_checkpoint = time.perf_counter()
+        while self.iteration < end_iteration:
+            if self.best_conflicts == 0 or not self.step():
+                break
+            if checkpoint_path and time.perf_counter() - last_checkpoint >= checkpoint_every:
+                self.save(checkpoint_path, end_iteration)
+                last_checkpoint = time.perf_counter()
+        if checkpoint_path:
+            self.save(checkpoint_path, end_iteration)
+        return self.best_board if self.best_conflicts == 0 else None
 
-def tabu_search(n, max_iterations=1000, tabu_size=50):
+def tabu_search(n, max_iterations=1000, tabu_size=50, checkpoint_path=None, checkpoint_every=60.0):
     """
     Perform Tabu Search to solve the N-Queens problem.
     
     Args:
     - n: size of the board (N x N)
     - max_iterations: maximum number of iterations
-    - tabu_size: size of the tabu list to prevent cycling
+    - tabu_size: number of iterations a queen may not return to a column it left
+    - checkpoint_path: file the search is checkpointed to, for resume_tabu_search (None: no checkpoints)
+    - checkpoint_every: minimum seconds between checkpoints
     
     Returns:
     - list representing the board if solution found, else None
     """
     
     # Initialize a random board
-    current_board = list(range(n))
-    random.shuffle(current_board)
-    current_conflicts = calculate_conflicts(current_board)
-    
-    best_board = current_board[:]
-    best_conflicts = current_conflicts
-    
-    # Tabu list to store recent moves (row, col) to avoid
-    tabu_list = deque(maxlen=tabu_size)
-    
-    iteration = 0
-    while iteration < max_iterations:
-        neighbors = get_neighbors(current_board)
-        best_neighbor = None
-        best_neighbor_conflicts = float('inf')
-        best_move = None
-        
-        # Find the best non-tabu neighbor
-        for neighbor, row, new_col in neighbors:
-            conflicts = calculate_conflicts(neighbor)
-            if conflicts < best_neighbor_conflicts and (row, new_col) not in tabu_list:
-                best_neighbor = neighbor
-                best_neighbor_conflicts = conflicts
-                best_move = (row, new_col)
-        
-        # If no valid neighbor found, break (stuck)
-        if best_neighbor is None:
-            break
-        
-        # Update current solution
-        current_board = best_neighbor
-        current_conflicts = best_neighbor_conflicts
-        tabu_list.append(best_move)
-        
-        # Update best solution if current is better
-        if current_conflicts < best_conflicts:
-            best_board = current_board[:]
-            best_conflicts = current_conflicts
-        
-        # Stop if a solution is found
-        if best_conflicts == 0:
-            return best_board
-        
-        iteration += 1
+    solution = TabuEngine(random_board(n), tenure=tabu_size).run(max_iterations, checkpoint_path, checkpoint_every)
+    return None if solution is None else solution.tolist()
+
+def resume_tabu_search(checkpoint_path, checkpoint_every=60.0):
+    """
+    Continue a tabu_search run from its checkpoint up to the iteration limit it was started with.
     
-    return best_board if best_conflicts == 0 else None
+    Returns:
+    - list representing the board if solution found, else None
+    """
+    engine, end_iteration = TabuEngine.load(checkpoint_path)
+    solution = engine.run(end_iteration - engine.iteration, checkpoint_path, checkpoint_every)
+    return None if solution is None else solution.tolist()
+
+if __name__ == "__main__":
+    # Example usage
+    n = 8  # for 8-Queens
+    solution = tabu_search(n)
 
-# Example usage
-n = 8  # for 8-Queens
-solution = tabu_search(n)
+    if solution:
+        print("Solution found:", solution)
+    else:
+        print("No solution found.")
 
-if solution:
-    print("Solution found:", solution)
-else:
-    print("No solution found.")
\ No newline at end of file
+    # Larger board, reporting iterations per second
+    engine = TabuEngine(random_board(1000))
+    began = time.perf_counter()
+    solution = engine.run(100000)
+    elapsed = time.perf_counter() - began
+    print(f"n=1000: {'solved' if solution else 'not solved'} after {engine.iteration} iterations "
+          f"({engine.iteration / elapsed:.0f} iterations/s)")
\ No newline at end of file
@@ -1,80 +1,79 @@
 # Timetabling as a Constraint Satisfaction Problem (CSP)
+#
+# The search runs on a CompiledCSP: courses and timeslots are indices, and each
+# check only visits the courses that share a constraint with the one assigned.
 
-from collections import defaultdict
+import sys
 
-def get_initial_domains(variables, domain):
+from Compiled_CSP import CompiledCSP, domain_values
+
+def get_initial_domains(problem):
     """Initialize domains for each variable."""
-    return {var: domain[:] for var in variables}
+    return problem.initial_domains()
 
-def count_constraints(var, value, assignment, constraints, domains):
+def count_constraints(problem, var, value, assignment, domains):
     """Count how many future variables would lose the given value due to constraints."""
     count = 0
-    for v1, v2 in constraints:
-        if v1 == var and v2 not in assignment:
-            if value in domains[v2]:
-                count += 1
-        elif v2 == var and v1 not in assignment:
-            if value in domains[v1]:
-                count += 1
+    for other in problem.neighbors[var]:
+        if other not in assignment and domains[other] >> value & 1:
+            count += 1
     return count
 
 def select_unassigned_variable(assignment, domains):
     """Select unassigned variable with Minimum Remaining Values (MRV) heuristic."""
-    unassigned = [var for var in domains if var not in assignment]
+    unassigned = [var for var in range(len(domains)) if var not in assignment]
     if not unassigned:
         return None
-    return min(unassigned, key=lambda var: len(domains[var]))
+    return min(unassigned, key=lambda var: domains[var].bit_count())
 
-def order_domain_values(var, domains, constraints, assignment):
+def order_domain_values(problem, var, domains, assignment):
     """Order values by Least Constraining Value (LCV) heuristic."""
-    return sorted(domains[var], key=lambda val: count_constraints(var, val, assignment, constraints, domains))
+    return sorted(domain_values(domains[var]),
+                  key=lambda val: count_constraints(problem, var, val, assignment, domains))
 
-def is_consistent(var, value, assignment, constraints):
+def is_consistent(problem, var, value, assignment):
     """Check if assigning var = value is consistent with current assignment."""
-    for v1, v2 in constraints:
-        if v1 == var and v2 in assignment and assignment[v2] == value:
-            return False
-        elif v2 == var and v1 in assignment and assignment[v1] == value:
+    for other in problem.neighbors[var]:
+        if other in assignment and assignment[other] == value:
             return False
     return True
 
-def forward_check(var, value, domains, constraints, assignment):
+def forward_check(problem, var, value, domains, assignment):
     """Apply forward checking to reduce domains of unassigned variables."""
-    reduced_domains = defaultdict(list)
-    for v1, v2 in constraints:
-        if v1 == var and v2 not in assignment and value in domains[v2]:
-            domains[v2].remove(value)
-            reduced_domains[v2].append(value)
-        elif v2 == var and v1 not in assignment and value in domains[v1]:
-            domains[v1].remove(value)
-            reduced_domains[v1].append(value)
+    bit = 1 << value
+    reduced_domains = {}
+    for other in problem.neighbors[var]:
+        if other not in assignment and domains[other] & bit:
+            domains[other] ^= bit
+            reduced_domains[other] = bit
     return reduced_domains
 
 def restore_domains(reduced_domains, domains):
     """Restore domains after backtracking."""
-    for var, values in reduced_domains.items():
-        domains[var].extend(values)
+    for var, removed in reduced_domains.items():
+        domains[var] |= removed
 
-def backtracking_search(variables, domains, constraints, assignment):
+def backtracking_search(problem, domains, assignment):
     """Perform backtracking search with MRV, LCV, and forward checking."""
-    if len(assignment) == len(variables):
+    if len(assignment) == len(problem.variables):
         return assignment
     
     var = select_unassigned_variable(assignment, domains)
     if var is None:
         return None
     
-    for value in order_domain_values(var, domains, constraints, assignment):
-        if is_consistent(var, value, assignment, constraints):
+    for value in order_domain_values(problem, var, domains, assignment):
+        if is_consistent(problem, var, value, assignment):
             assignment[var] = value
-            saved_domains = forward_check(var, value, domains, constraints, assignment)
+            saved_domains = forward_check(problem, var, value, domains, assignment)
             
-            if not any(len(domains[v]) == 0 for v in domains if v not in assignment):
+            # Only the domains forward checking reduced can have become empty
+            if any(domains[v] == 0 for v in saved_domains):
                 assignment.pop(var)
                 restore_domains(saved_domains, domains)
                 continue
             
-            result = backtracking_search(variables, domains, constraints, assignment)
+            result = backtracking_search(problem, domains, assignment)
             if result is not None:
                 return result
             
@@ -85,20 +84,25 @@ def backtracking_search(variables, domains, constraints, assignment):
 
 def solve_timetabling(variables, timeslots, constraints):
     """Solve the timetabling problem as a CSP."""
-    domains = get_initial_domains(variables, timeslots)
+    problem = CompiledCSP(variables, timeslots, constraints)
+    # The search recurses once per assigned course
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), len(problem.variables) + 100))
+    domains = get_initial_domains(problem)
     assignment = {}
-    return backtracking_search(variables, domains, constraints, assignment)
+    result = backtracking_search(problem, domains, assignment)
+    return None if result is None else problem.decode(result)
 
-# Example usage
-variables = ['C1', 'C2', 'C3', 'C4']
-timeslots = ['T1', 'T2', 'T3', 'T4']
-constraints = [('C1', 'C2'), ('C3', 'C4')]
+if __name__ == "__main__":
+    # Example usage
+    variables = ['C1', 'C2', 'C3', 'C4']
+    timeslots = ['T1', 'T2', 'T3', 'T4']
+    constraints = [('C1', 'C2'), ('C3', 'C4')]
 
-solution = solve_timetabling(variables, timeslots, constraints)
+    solution = solve_timetabling(variables, timeslots, constraints)
 
-if solution:
-    print("Timetable solution found:")
-    for course, timeslot in solution.items():
-        print(f"{course}: {timeslot}")
-else:
-    print("No solution found.")
\ No newline at end of file
+    if solution:
+        print("Timetable solution found:")
+        for course, timeslot in solution.items():
+            print(f"{course}: {timeslot}")
+    else:
+        print("No solution found.")
\ No newline at end of file
@@ -10,39 +10,60 @@ maze = [
 start = (0, 0)
 goal = (4, 4)
 
-from heapq import heappush, heappop
+from Indexed_Priority_Queue import IndexedPriorityQueue
+from Search_Stepper import run_to_completion
 
 def is_valid(row, col):
     """Check if the position is within bounds and is an open path (0)."""
     return 0 <= row < len(maze) and 0 <= col < len(maze[0]) and maze[row][col] == 0
 
-def uniform_cost_search(start, goal):
+def reconstruct_path(came_from, current):
+    """Follow predecessor links back from current to the start position."""
+    path = [current]
+    while current in came_from:
+        current = came_from[current]
+        path.append(current)
+    path.reverse()
+    return path
+
+def uniform_cost_search_steps(start, goal, nodes_per_step=100):
     """
-    Perform Uniform Cost Search to find the shortest path from start to goal.
+    Perform Uniform Cost Search as a generator that yields control every nodes_per_step expansions.
     
     Args:
     - start: tuple (row, col) of start position
     - goal: tuple (row, col) of goal position
+    - nodes_per_step: maximum number of nodes to expand before yielding
+    
+    Yields:
+    - int: number of nodes expanded since the previous yield
     
     Returns:
-    - list of positions representing the shortest path if found, else None
+    - the result of uniform_cost_search, as the generator's completion value
     """
+    if nodes_per_step < 1:
+        raise ValueError(f"nodes_per_step must be at least 1, got {nodes_per_step}")
     
-    # Priority queue to store (cost, current_position, path)
-    queue = [(0, start, [start])]
+    # Indexed priority queue keyed by position with path cost priority (one entry per open node)
+    queue = IndexedPriorityQueue()
+    queue.push(start, 0)
     visited = set()
+    came_from = {}
     
     directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Up, down, left, right
     
+    expanded = 0
     while queue:
-        cost, current, path = heappop(queue)
+        if expanded == nodes_per_step:
+            yield expanded
+            expanded = 0
+        current, cost = queue.pop()
+        expanded += 1
         row, col = current
         
         if current == goal:
-            return path
-        
-        if current in visited:
-            continue
+            yield expanded
+            return reconstruct_path(came_from, current)
         
         visited.add(current)
         
@@ -50,11 +71,26 @@ def uniform_cost_search(start, goal):
             nr, nc = row + dr, col + dc
             if is_valid(nr, nc) and (nr, nc) not in visited:
                 new_cost = cost + 1  # Uniform cost of 1 for each move
-                new_path = path + [(nr, nc)]
-                heappush(queue, (new_cost, (nr, nc), new_path))
+                # Insert, or decrease the key if this route is cheaper
+                if queue.push((nr, nc), new_cost):
+                    came_from[(nr, nc)] = current
     
+    yield expanded
     return None
 
+def uniform_cost_search(start, goal):
+    """
+    Perform Uniform Cost Search to find the shortest path from start to goal.
+    
+    Args:
+    - start: tuple (row, col) of start position
+    - goal: tuple (row, col) of goal position
+    
+    Returns:
+    - list of positions representing the shortest path if found, else None
+    """
+    return run_to_completion(uniform_cost_search_steps(start, goal))
+
 # Example usage
 result_path = uniform_cost_search(start, goal)
 